@@ -4,6 +4,7 @@ import os
 import json
 import math
 import logging
+from functools import lru_cache
 from typing import Optional
 from scipy.stats import fisher_exact, combine_pvalues
 from statsmodels.stats.multitest import multipletests
@@ -16,14 +17,14 @@ from validation import validate_form_data, validate_file_upload, log_validation_
 from helpers import load_reference_sets
 from cache_manager import cache, cached_data_loader
 from exceptions import AOPAnalysisError, format_error_response
-from utils import cleanup_file, validate_file_path
+from utils import cleanup_file, validate_file_path, dumps_json, loads_json
 from services.data_service import load_and_validate_data, process_gene_expression, guess_id_type, load_aop_data
 from services.enrichment_service import run_enrichment_analysis, build_ke_gene_mapping
 from services.network_service import build_cytoscape_network
 from services.column_detector import column_detector
 from services.gene_id_validator import gene_id_validator
 from database import db_manager, init_database
-from services.report_service import report_generator, ReportData, get_software_versions
+from services.report_service import report_generator, ReportData, get_software_versions, SVG_SUPPORT
 
 # Configure logging
 logging.basicConfig(
@@ -57,6 +58,27 @@ def allowed_file(filename):
     """
     return '.' in filename and filename.rsplit('.', 1)[1].lower() in Config.ALLOWED_EXTENSIONS
 
+@lru_cache(maxsize=2)
+def _read_dataset(filepath, mtime_ns, size):
+    """Parse a dataset file, memoized on its path and on-disk version.
+    
+    Preview posts the same file repeatedly (load, then confirm columns), so
+    repeats reuse the parsed frame; a re-upload changes mtime/size and
+    misses the cache. Only the last two files are kept, and /analyze clears
+    the cache once it removes the upload. The preview route only reads the
+    returned DataFrame; callers must not modify it.
+    
+    Args:
+        filepath: Path to the CSV/TSV file
+        mtime_ns: File modification time in nanoseconds (cache key only)
+        size: File size in bytes (cache key only)
+        
+    Returns:
+        pd.DataFrame: Parsed dataset
+    """
+    # Use pandas' automatic separator detection for CSV/TSV files
+    return pd.read_csv(filepath, sep=None, engine='python')
+
 @app.errorhandler(RequestEntityTooLarge)
 def handle_file_too_large(e):
     """Handle file upload size limit exceeded error.
@@ -202,8 +224,8 @@ def preview():
     if not os.path.exists(filepath):
         return f"File not found: {filepath}", 400
     try:
-        # Use pandas' automatic separator detection for CSV/TSV files
-        df = pd.read_csv(filepath, sep=None, engine='python')
+        file_stat = os.stat(filepath)
+        df = _read_dataset(filepath, file_stat.st_mtime_ns, file_stat.st_size)
     except Exception as e:
         return f"Failed to read dataset: {e}", 400
 
@@ -422,8 +444,9 @@ def analyze():
         # Guess gene ID type for display
         id_type = guess_id_type(df_processed['ID'])
         
-        # Clean up uploaded file
+        # Clean up uploaded file, and drop its parsed frame from the preview cache
         cleanup_file(filepath)
+        _read_dataset.cache_clear()
         
         logger.info("Analysis completed successfully")
         
@@ -492,7 +515,8 @@ def analyze():
                 elif isinstance(value, (pd.Series, pd.DataFrame)):
                     row[key] = str(value)  # Convert complex pandas objects to strings
         
-        # Pre-serialize JSON for template
+        # Pre-serialize JSON for template; the table is posted back for reports, so use the
+        # standard library, which keeps infinite odds ratios as Infinity (orjson writes null)
         table_json_str = json.dumps(enrichment_table)
         logger.info(f"Template JSON: length={len(table_json_str)}, first 200 chars: {table_json_str[:200]}")
         
@@ -501,15 +525,16 @@ def analyze():
             table=enrichment_table,
             table_json=table_json_str,  # Pre-serialize for template
             volcano_data=volcano_data,
-            volcano_json=json.dumps(volcano_data),  # Pre-serialize for template
+            volcano_json=dumps_json(volcano_data),  # Pre-serialize for template
             id_type=id_type,
             background_size=stats['total_genes'],
             threshold=logfc_threshold,
-            network_json=json.dumps(cy_network),
-            ke_gene_json=json.dumps(ke_gene_map),
-            ke_type_map=json.dumps(ke_type_map),
-            ke_title_map=json.dumps(ke_title_map),
+            network_json=dumps_json(cy_network),
+            ke_gene_json=dumps_json(ke_gene_map),
+            ke_type_map=dumps_json(ke_type_map),
+            ke_title_map=dumps_json(ke_title_map),
             metadata=stored_metadata,
+            network_svg_export=SVG_SUPPORT,
         )
         
     except AOPAnalysisError as e:
@@ -571,7 +596,7 @@ def generate_report():
                 import html
                 enrichment_results_str = html.unescape(enrichment_results_str)
                 logger.info(f"After HTML unescape: {enrichment_results_str[:200]}")
-                enrichment_results = json.loads(enrichment_results_str)
+                enrichment_results = loads_json(enrichment_results_str)
                 logger.info(f"Successfully parsed {len(enrichment_results)} enrichment results")
                 if enrichment_results:
                     logger.info(f"First result keys: {list(enrichment_results[0].keys())}")
@@ -587,9 +612,9 @@ def generate_report():
         
         # Get network PNG data and log it
         network_png_data = request.form.get('network_png', '')
-        logger.info(f"Network PNG form data length: {len(network_png_data)}")
+        logger.info("Network PNG form data length: %d", len(network_png_data))
         if network_png_data:
-            logger.info(f"Network PNG starts with: {network_png_data[:50]}...")
+            logger.info("Network PNG starts with: %s...", network_png_data[:50])
         else:
             logger.warning("No network PNG data received from form")
         
@@ -607,8 +632,8 @@ def generate_report():
             pval_column=request.form.get('pval_column', ''),
             id_type=request.form.get('id_type', ''),
             enrichment_results=enrichment_results,
-            volcano_data=json.loads(request.form.get('volcano_data', '[]')) if request.form.get('volcano_data') else None,
-            network_data=json.loads(request.form.get('network_data', '{}')) if request.form.get('network_data') else None,
+            volcano_data=loads_json(request.form.get('volcano_data', '[]')) if request.form.get('volcano_data') else None,
+            network_data=loads_json(request.form.get('network_data', '{}')) if request.form.get('network_data') else None,
             network_png=network_png_data,
             software_versions=get_software_versions()
         )
@@ -631,10 +656,13 @@ def generate_report():
                 return f"PDF generation not available: {e}", 400
                 
         elif report_format == 'html':
-            html_content = report_generator.generate_html_report(report_data)
-            
-            # Create response with HTML
-            response = make_response(html_content)
+            # Inline figure JSON makes large reports compress well, so gzip when the client accepts it
+            if request.accept_encodings['gzip']:
+                response = make_response(report_generator.generate_html_report_gzip(report_data))
+                response.headers['Content-Encoding'] = 'gzip'
+            else:
+                response = make_response(report_generator.generate_html_report(report_data))
+            response.headers['Vary'] = 'Accept-Encoding'
             response.headers['Content-Type'] = 'text/html'
             response.headers['Content-Disposition'] = f'attachment; filename="AOP_Analysis_Report_{metadata.get("dataset_id", "report")}.html"'
             
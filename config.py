@@ -65,7 +65,7 @@ class Config:
         return True
 
 
-@dataclass
+@dataclass(slots=True)
 class ExperimentMetadata:
     """Dataclass for storing experiment metadata for reports."""
     dataset_id: str
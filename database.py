@@ -5,11 +5,11 @@ Provides SQLite-based persistence for experiment metadata and analysis results.
 """
 
 from datetime import datetime
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List
 import json
-from sqlalchemy import create_engine, Column, Integer, String, DateTime, Text, Float
+from sqlalchemy import create_engine, event, insert, Column, Integer, String, DateTime, Text, Float
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.orm import scoped_session, sessionmaker
 from sqlalchemy.exc import SQLAlchemyError
 import logging
 
@@ -74,16 +74,35 @@ class ExperimentRecord(Base):
         }
 
 
+# Options for every session the manager hands out
+SESSION_OPTIONS = {
+    'autocommit': False,
+    'autoflush': False,
+    'expire_on_commit': False,  # Records are read straight after commit
+}
+
+
+def _set_sqlite_pragmas(dbapi_connection, connection_record):
+    """Use WAL journaling so each commit appends to the log instead of syncing the database file."""
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.close()
+
+
 class DatabaseManager:
     """Manager class for database operations."""
     
-    def __init__(self, db_url: str = "sqlite:///molAOP_analyser.db"):
+    def __init__(self, db_url: str = "sqlite:///molAOP_analyser.db", **engine_options):
         """Initialize database manager.
         
         Args:
             db_url: SQLAlchemy database URL (defaults to SQLite)
+            **engine_options: Extra keyword arguments for create_engine
+                (e.g. poolclass=StaticPool for an in-memory SQLite database)
         """
         self.db_url = db_url
+        self.engine_options = engine_options
         self.engine = None
         self.SessionLocal = None
         
@@ -94,17 +113,16 @@ class DatabaseManager:
                 self.db_url,
                 echo=False,  # Set to True for SQL debugging
                 pool_pre_ping=True,  # Verify connections before use
+                **self.engine_options
             )
+            if self.engine.dialect.name == 'sqlite':
+                event.listen(self.engine, 'connect', _set_sqlite_pragmas)
             
             # Create all tables
             Base.metadata.create_all(bind=self.engine)
             
-            # Create session factory
-            self.SessionLocal = sessionmaker(
-                autocommit=False,
-                autoflush=False,
-                bind=self.engine
-            )
+            # Create session registry (one reusable session per thread)
+            self.SessionLocal = scoped_session(sessionmaker(bind=self.engine, **SESSION_OPTIONS))
             
             logger.info(f"Database initialized successfully: {self.db_url}")
             return True
@@ -114,7 +132,7 @@ class DatabaseManager:
             return False
     
     def get_session(self):
-        """Get a new database session."""
+        """Get the database session for the current thread."""
         if not self.SessionLocal:
             raise RuntimeError("Database not initialized. Call initialize() first.")
         return self.SessionLocal()
@@ -134,32 +152,7 @@ class DatabaseManager:
         """
         session = self.get_session()
         try:
-            record = ExperimentRecord(
-                dataset_id=metadata.get('dataset_id', ''),
-                filename=metadata.get('filename', ''),
-                stressor=metadata.get('stressor', ''),
-                dosing=metadata.get('dosing', ''),
-                owner=metadata.get('owner', ''),
-                description=metadata.get('description', ''),
-                upload_timestamp=datetime.fromisoformat(metadata['upload_timestamp']) 
-                    if metadata.get('upload_timestamp') else datetime.utcnow()
-            )
-            
-            # Add analysis parameters if provided
-            if analysis_params:
-                record.aop_id = analysis_params.get('aop_id')
-                record.logfc_threshold = analysis_params.get('logfc_threshold')
-                record.pval_cutoff = analysis_params.get('pval_cutoff')
-                record.id_column = analysis_params.get('id_column')
-                record.fc_column = analysis_params.get('fc_column')
-                record.pval_column = analysis_params.get('pval_column')
-                record.analysis_timestamp = datetime.utcnow()
-            
-            # Add results summary if provided
-            if results:
-                record.enrichment_results = json.dumps(results.get('enrichment_table', []))
-                record.gene_count = results.get('gene_count')
-                record.significant_genes = results.get('significant_genes')
+            record = ExperimentRecord(**self._record_values(metadata, analysis_params, results))
             
             session.add(record)
             session.commit()
@@ -175,6 +168,73 @@ class DatabaseManager:
         finally:
             session.close()
     
+    def save_experiment_metadata_bulk(self, records: List[Dict[str, Any]]) -> List[int]:
+        """Save several experiment metadata records in one multi-row INSERT.
+        
+        Args:
+            records: Experiment metadata dictionaries
+            
+        Returns:
+            Experiment record IDs in input order, or an empty list on failure
+        """
+        if not records:
+            return []
+        
+        session = self.get_session()
+        try:
+            rows = [self._record_values(metadata) for metadata in records]
+            statement = insert(ExperimentRecord).returning(ExperimentRecord.id, sort_by_parameter_order=True)
+            experiment_ids = list(session.scalars(statement, rows))
+            session.commit()
+            
+            logger.info(f"Saved {len(experiment_ids)} experiment records")
+            return experiment_ids
+            
+        except SQLAlchemyError as e:
+            session.rollback()
+            logger.error(f"Failed to save experiment metadata batch: {e}")
+            return []
+        finally:
+            session.close()
+    
+    @staticmethod
+    def _record_values(metadata: Dict[str, Any],
+                       analysis_params: Optional[Dict[str, Any]] = None,
+                       results: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """Map metadata, analysis parameters and results onto ExperimentRecord columns."""
+        values = {
+            'dataset_id': metadata.get('dataset_id', ''),
+            'filename': metadata.get('filename', ''),
+            'stressor': metadata.get('stressor', ''),
+            'dosing': metadata.get('dosing', ''),
+            'owner': metadata.get('owner', ''),
+            'description': metadata.get('description', ''),
+            'upload_timestamp': datetime.fromisoformat(metadata['upload_timestamp'])
+                if metadata.get('upload_timestamp') else datetime.utcnow()
+        }
+        
+        # Add analysis parameters if provided
+        if analysis_params:
+            values.update({
+                'aop_id': analysis_params.get('aop_id'),
+                'logfc_threshold': analysis_params.get('logfc_threshold'),
+                'pval_cutoff': analysis_params.get('pval_cutoff'),
+                'id_column': analysis_params.get('id_column'),
+                'fc_column': analysis_params.get('fc_column'),
+                'pval_column': analysis_params.get('pval_column'),
+                'analysis_timestamp': datetime.utcnow()
+            })
+        
+        # Add results summary if provided
+        if results:
+            values.update({
+                'enrichment_results': json.dumps(results.get('enrichment_table', [])),
+                'gene_count': results.get('gene_count'),
+                'significant_genes': results.get('significant_genes')
+            })
+        
+        return values
+    
     def get_experiment(self, experiment_id: int) -> Optional[Dict[str, Any]]:
         """Retrieve experiment record by ID.
         
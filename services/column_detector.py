@@ -3,7 +3,12 @@ Intelligent column detection service for gene expression datasets.
 Automatically identifies gene ID, log2FC, and p-value columns.
 """
 import re
+import copy
+import hashlib
 import logging
+from collections import OrderedDict
+from functools import lru_cache
+from threading import Lock
 from typing import Dict, List, Tuple, Optional
 from dataclasses import dataclass
 import pandas as pd
@@ -13,6 +18,21 @@ from services.gene_id_validator import gene_id_validator, GeneIDAnalysis
 
 logger = logging.getLogger(__name__)
 
+
+@lru_cache(maxsize=None)
+def _compile_patterns(patterns: Tuple[str, ...]) -> re.Pattern:
+    """Combine a pattern group into one compiled alternation."""
+    return re.compile('|'.join(f'(?:{pattern})' for pattern in patterns))
+
+
+@lru_cache(maxsize=4096)
+def _score_name(col_lower: str, patterns: Tuple[str, ...]) -> float:
+    """Score a normalized column name; header names recur across uploads."""
+    regex = _compile_patterns(patterns)
+    if regex.fullmatch(col_lower):
+        return 1.0  # Exact match gets higher score
+    return 0.8 if regex.search(col_lower) else 0
+
 @dataclass
 class ColumnMatch:
     """Represents a potential column match with confidence score."""
@@ -54,24 +74,63 @@ class ColumnDetector:
         r'fdr', r'q.*val', r'qval', r'significance', r'p.*value'
     ]
     
+    # Number of recent detect_columns results kept per detector
+    RESULT_CACHE_SIZE = 64
+    
     def __init__(self):
         """Initialize the column detector."""
         self.min_confidence = 0.3
         self.high_confidence = 0.8
+        self._results: OrderedDict = OrderedDict()
+        self._results_lock = Lock()
         
     def detect_columns(self, df: pd.DataFrame) -> ColumnSuggestions:
         """
         Detect all relevant columns in a DataFrame.
         
+        Results are cached on a fingerprint of the frame's columns, dtypes
+        and contents, so re-detecting an unchanged dataset is a lookup.
+        Each call returns its own copy, so callers may modify the result.
+        
         Args:
             df: Input DataFrame to analyze
             
         Returns:
             ColumnSuggestions with ranked matches for each column type
         """
+        key = self._fingerprint(df)
+        if key is not None:
+            with self._results_lock:
+                cached = self._results.get(key)
+                if cached is not None:
+                    self._results.move_to_end(key)
+                    return copy.deepcopy(cached)
+        
+        suggestions = self._detect_columns(df)
+        
+        if key is not None:
+            with self._results_lock:
+                self._results[key] = copy.deepcopy(suggestions)
+                if len(self._results) > self.RESULT_CACHE_SIZE:
+                    self._results.popitem(last=False)
+        return suggestions
+    
+    def _fingerprint(self, df: pd.DataFrame) -> Optional[Tuple]:
+        """Build a cache key from column names, dtypes and a digest of the row hashes, or None if unhashable."""
+        try:
+            row_hashes = pd.util.hash_pandas_object(df, index=False).to_numpy()
+        except TypeError:
+            return None
+        # Digest the ordered hash array; a plain sum would ignore row order and collide easily
+        content_hash = hashlib.blake2b(row_hashes.tobytes(), digest_size=16).digest()
+        return (tuple(df.columns), tuple(str(dtype) for dtype in df.dtypes), len(df), content_hash)
+    
+    def _detect_columns(self, df: pd.DataFrame) -> ColumnSuggestions:
+        """Run column detection without consulting the result cache."""
+        numeric = self._numeric_columns(df)
         gene_id_matches = self._detect_gene_id_columns(df)
-        log2fc_matches = self._detect_log2fc_columns(df)
-        pvalue_matches = self._detect_pvalue_columns(df)
+        log2fc_matches = self._detect_log2fc_columns(df, numeric)
+        pvalue_matches = self._detect_pvalue_columns(df, numeric)
         
         # Sort by confidence (highest first)
         gene_id_matches.sort(key=lambda x: x.confidence, reverse=True)
@@ -92,6 +151,37 @@ class ColumnDetector:
             best_pvalue=best_pvalue
         )
     
+    def _numeric_columns(self, df: pd.DataFrame) -> Dict[str, Tuple[int, np.ndarray]]:
+        """
+        Extract the numeric values of every column once for content analysis.
+        
+        Numeric-dtype columns are converted together in one contiguous float64
+        block; other columns are coerced individually.
+        
+        Args:
+            df: Input DataFrame to analyze
+            
+        Returns:
+            Mapping of column name to (non-null count, float64 array of numeric values)
+        """
+        numeric = {}
+        
+        block = df.select_dtypes(include=np.number)
+        values = block.to_numpy(dtype=np.float64, na_value=np.nan)
+        present = ~np.isnan(values)
+        counts = present.sum(axis=0)
+        for i, col_name in enumerate(block.columns):
+            numeric[col_name] = (int(counts[i]), values[present[:, i], i])
+        
+        for col_name in df.columns.difference(block.columns, sort=False):
+            column_data = df[col_name].dropna()
+            numeric[col_name] = (
+                len(column_data),
+                pd.to_numeric(column_data, errors='coerce').dropna().to_numpy(dtype=np.float64)
+            )
+        
+        return numeric
+    
     def _detect_gene_id_columns(self, df: pd.DataFrame) -> List[ColumnMatch]:
         """Detect potential gene ID columns."""
         matches = []
@@ -103,23 +193,25 @@ class ColumnDetector:
                 
         return matches
     
-    def _detect_log2fc_columns(self, df: pd.DataFrame) -> List[ColumnMatch]:
+    def _detect_log2fc_columns(self, df: pd.DataFrame,
+                              numeric: Optional[Dict[str, Tuple[int, np.ndarray]]] = None) -> List[ColumnMatch]:
         """Detect potential log2 fold change columns."""
         matches = []
         
         for col_name in df.columns:
-            match = self._analyze_log2fc_column(df, col_name)
+            match = self._analyze_log2fc_column(df, col_name, numeric)
             if match and match.confidence >= self.min_confidence:
                 matches.append(match)
                 
         return matches
     
-    def _detect_pvalue_columns(self, df: pd.DataFrame) -> List[ColumnMatch]:
+    def _detect_pvalue_columns(self, df: pd.DataFrame,
+                              numeric: Optional[Dict[str, Tuple[int, np.ndarray]]] = None) -> List[ColumnMatch]:
         """Detect potential p-value columns."""
         matches = []
         
         for col_name in df.columns:
-            match = self._analyze_pvalue_column(df, col_name)
+            match = self._analyze_pvalue_column(df, col_name, numeric)
             if match and match.confidence >= self.min_confidence:
                 matches.append(match)
                 
@@ -180,11 +272,14 @@ class ColumnDetector:
             data_analysis=data_analysis
         )
     
-    def _analyze_log2fc_column(self, df: pd.DataFrame, col_name: str) -> Optional[ColumnMatch]:
+    def _analyze_log2fc_column(self, df: pd.DataFrame, col_name: str,
+                              numeric: Optional[Dict[str, Tuple[int, np.ndarray]]] = None) -> Optional[ColumnMatch]:
         """Analyze a potential log2FC column."""
-        column_data = df[col_name].dropna()
+        if numeric is None:
+            numeric = self._numeric_columns(df[[col_name]])
+        total_count, values = numeric[col_name]
         
-        if len(column_data) == 0:
+        if total_count == 0:
             return None
             
         reasons = []
@@ -198,21 +293,21 @@ class ColumnDetector:
         
         # Content-based analysis
         try:
-            # Convert to numeric, skip non-numeric values
-            numeric_data = pd.to_numeric(column_data, errors='coerce').dropna()
-            
-            if len(numeric_data) < len(column_data) * 0.8:
+            # Skip columns with too many non-numeric values
+            if len(values) < total_count * 0.8:
                 reasons.append("Contains significant non-numeric values")
                 return None  # Too many non-numeric values
             
             content_score = 0
             
             # Check value range (typical log2FC range: -10 to +10)
-            data_range = numeric_data.max() - numeric_data.min()
-            mean_val = numeric_data.mean()
-            std_val = numeric_data.std()
+            min_val = values.min()
+            max_val = values.max()
+            data_range = max_val - min_val
+            mean_val = values.mean()
+            std_val = values.std(ddof=1) if len(values) > 1 else np.nan
             
-            if -15 <= numeric_data.min() <= 15 and -15 <= numeric_data.max() <= 15:
+            if -15 <= min_val <= 15 and -15 <= max_val <= 15:
                 content_score += 0.3
                 reasons.append("Values in typical log2FC range")
             
@@ -227,7 +322,7 @@ class ColumnDetector:
                 reasons.append("Standard deviation in expected range")
             
             # Check for both positive and negative values
-            if (numeric_data > 0).any() and (numeric_data < 0).any():
+            if max_val > 0 and min_val < 0:
                 content_score += 0.2
                 reasons.append("Contains both up and down regulation")
             
@@ -237,11 +332,11 @@ class ColumnDetector:
                 'numeric_stats': {
                     'mean': float(mean_val),
                     'std': float(std_val),
-                    'min': float(numeric_data.min()),
-                    'max': float(numeric_data.max()),
+                    'min': float(min_val),
+                    'max': float(max_val),
                     'range': float(data_range)
                 },
-                'sample_data': numeric_data.head(5).tolist()
+                'sample_data': values[:5].tolist()
             }
             
         except Exception as e:
@@ -262,11 +357,14 @@ class ColumnDetector:
             data_analysis=data_analysis
         )
     
-    def _analyze_pvalue_column(self, df: pd.DataFrame, col_name: str) -> Optional[ColumnMatch]:
+    def _analyze_pvalue_column(self, df: pd.DataFrame, col_name: str,
+                              numeric: Optional[Dict[str, Tuple[int, np.ndarray]]] = None) -> Optional[ColumnMatch]:
         """Analyze a potential p-value column."""
-        column_data = df[col_name].dropna()
+        if numeric is None:
+            numeric = self._numeric_columns(df[[col_name]])
+        total_count, values = numeric[col_name]
         
-        if len(column_data) == 0:
+        if total_count == 0:
             return None
             
         reasons = []
@@ -280,31 +378,30 @@ class ColumnDetector:
         
         # Content-based analysis
         try:
-            numeric_data = pd.to_numeric(column_data, errors='coerce').dropna()
-            
-            if len(numeric_data) < len(column_data) * 0.8:
+            if len(values) < total_count * 0.8:
                 reasons.append("Contains significant non-numeric values")
                 return None
             
             content_score = 0
+            min_val = values.min()
+            max_val = values.max()
             
             # Check if values are in [0, 1] range
-            if (numeric_data >= 0).all() and (numeric_data <= 1).all():
+            if min_val >= 0 and max_val <= 1:
                 content_score += 0.4
                 reasons.append("All values in [0, 1] range")
             
             # Check for typical p-value distribution (more small values)
-            small_pvals = (numeric_data < 0.05).sum()
-            medium_pvals = ((numeric_data >= 0.05) & (numeric_data < 0.5)).sum()
-            large_pvals = (numeric_data >= 0.5).sum()
+            small_pvals = np.count_nonzero(values < 0.05)
+            large_pvals = np.count_nonzero(values >= 0.5)
             
             if small_pvals > 0 and large_pvals > 0:
                 content_score += 0.2
                 reasons.append("Contains mix of significant and non-significant values")
             
             # Check for absence of exactly 0 or 1 (which are suspicious for p-values)
-            exact_zeros = (numeric_data == 0).sum()
-            exact_ones = (numeric_data == 1).sum()
+            exact_zeros = np.count_nonzero(values == 0)
+            exact_ones = np.count_nonzero(values == 1)
             
             if exact_zeros == 0 and exact_ones == 0:
                 content_score += 0.1
@@ -314,13 +411,13 @@ class ColumnDetector:
             
             data_analysis = {
                 'pvalue_stats': {
-                    'min': float(numeric_data.min()),
-                    'max': float(numeric_data.max()),
-                    'mean': float(numeric_data.mean()),
+                    'min': float(min_val),
+                    'max': float(max_val),
+                    'mean': float(values.mean()),
                     'significant_count': int(small_pvals),
-                    'total_count': len(numeric_data)
+                    'total_count': len(values)
                 },
-                'sample_data': numeric_data.head(5).tolist()
+                'sample_data': values[:5].tolist()
             }
             
         except Exception as e:
@@ -343,18 +440,7 @@ class ColumnDetector:
     
     def _score_column_name(self, col_name: str, patterns: List[str]) -> float:
         """Score column name against pattern list."""
-        col_lower = col_name.lower().strip()
-        max_score = 0
-        
-        for pattern in patterns:
-            if re.search(pattern, col_lower):
-                # Exact match gets higher score
-                if re.fullmatch(pattern, col_lower):
-                    max_score = max(max_score, 1.0)
-                else:
-                    max_score = max(max_score, 0.8)
-        
-        return max_score
+        return _score_name(col_name.lower().strip(), tuple(patterns))
     
     def get_confidence_description(self, confidence: float) -> str:
         """Get human-readable confidence description."""
@@ -4,32 +4,34 @@ Supports HGNC symbols, Ensembl Gene IDs, and NCBI Gene IDs.
 """
 import re
 import logging
-from typing import Dict, List, Tuple, Optional, Set
+from functools import lru_cache
+from typing import Dict, List, Tuple, Optional, Set, Union
 from dataclasses import dataclass
 from collections import Counter
+from itertools import islice
 import pandas as pd
 
 logger = logging.getLogger(__name__)
 
-@dataclass
+@dataclass(slots=True)
 class ValidationResult:
     """Result of gene ID validation."""
     id_type: str
     total_ids: int
     valid_ids: int
-    invalid_ids: List[str]
+    invalid_ids: Tuple[str, ...]
     confidence: float
     mixed_types: bool
     type_distribution: Dict[str, int]
 
-@dataclass
+@dataclass(slots=True)
 class GeneIDAnalysis:
     """Comprehensive analysis of a gene ID column."""
     primary_type: str
     confidence: float
     validation_result: ValidationResult
-    recommendations: List[str]
-    warnings: List[str]
+    recommendations: Tuple[str, ...]
+    warnings: Tuple[str, ...]
 
 class GeneIDValidator:
     """Enhanced gene ID validator supporting multiple ID types."""
@@ -37,53 +39,69 @@ class GeneIDValidator:
     # Gene ID patterns for different identifier types
     GENE_ID_PATTERNS = {
         'HGNC': re.compile(r'^[A-Z][A-Z0-9-]*[A-Z0-9]$|^[A-Z]$'),  # HGNC symbols
-        'Ensembl': re.compile(r'^ENSG\d{11}(\.\d+)?$'),  # Ensembl with optional version
+        'Ensembl': re.compile(r'^ENSG\d{11}(\.\d+)?$', re.IGNORECASE),  # Ensembl with optional version
         'NCBI': re.compile(r'^\d+$'),  # NCBI Gene IDs (Entrez)
-        'Probe': re.compile(r'^[A-Za-z0-9_-]+(_at|_s_at|_x_at)$'),  # Microarray probes
-        'RefSeq': re.compile(r'^(NM_|XM_|NR_|XR_)\d+(\.\d+)?$'),  # RefSeq IDs
+        'Probe': re.compile(r'^[A-Za-z0-9_-]+(_at|_s_at|_x_at)$', re.IGNORECASE),  # Microarray probes
+        'RefSeq': re.compile(r'^(NM_|XM_|NR_|XR_)\d+(\.\d+)?$', re.IGNORECASE),  # RefSeq IDs
     }
     
+    # Types matched against the uppercased ID (all other patterns ignore case, so
+    # probe suffixes such as '_s_at' match in either case)
+    CASE_SENSITIVE_TYPES = {'HGNC'}
+    
     # Confidence thresholds
     HIGH_CONFIDENCE_THRESHOLD = 0.85
     MEDIUM_CONFIDENCE_THRESHOLD = 0.60
     MIXED_TYPE_THRESHOLD = 0.20  # If secondary type >20%, consider mixed
     
+    # Adaptive sampling: stop early once one type clearly dominates
+    ADAPTIVE_MIN_SAMPLE = 64
+    ADAPTIVE_CHECK_INTERVAL = 32
+    ADAPTIVE_DOMINANCE_THRESHOLD = 0.95
+    
     def __init__(self):
         """Initialize the validator."""
-        self.supported_types = {'HGNC', 'Ensembl', 'NCBI'}  # Main supported types
+        self.supported_types = frozenset({'HGNC', 'Ensembl', 'NCBI'})  # Main supported types
         
-    def validate_gene_ids(self, gene_ids: List[str], sample_size: int = 200) -> ValidationResult:
+    def validate_gene_ids(self, gene_ids: Union[List[str], pd.Series], sample_size: int = 200,
+                          adaptive: bool = False) -> ValidationResult:
         """
         Validate a list of gene identifiers.
         
         Args:
-            gene_ids: List of gene identifiers to validate
+            gene_ids: List or pandas Series of gene identifiers to validate
             sample_size: Maximum number of IDs to analyze for performance
+            adaptive: Stop sampling early once a single ID type clearly dominates.
+                Off by default; when enabled, total_ids reflects the number of IDs
+                actually analyzed rather than the sample size.
             
         Returns:
             ValidationResult with detailed analysis
         """
-        if not gene_ids:
+        if len(gene_ids) == 0:
             return ValidationResult(
                 id_type="Unknown",
                 total_ids=0,
                 valid_ids=0,
-                invalid_ids=[],
+                invalid_ids=(),
                 confidence=0.0,
                 mixed_types=False,
                 type_distribution={}
             )
         
         # Sample IDs for performance (analyze first N non-empty entries)
-        clean_ids = [str(id_).strip().upper() for id_ in gene_ids if pd.notna(id_) and str(id_).strip()]
-        sample_ids = clean_ids[:sample_size]
+        if isinstance(gene_ids, pd.Series):
+            sample_ids = self._sample_series(gene_ids, sample_size)
+        else:
+            clean_ids = (s for s in (str(id_).strip() for id_ in gene_ids if pd.notna(id_)) if s)
+            sample_ids = list(islice(clean_ids, sample_size))
         
         if not sample_ids:
             return ValidationResult(
                 id_type="Unknown",
                 total_ids=len(gene_ids),
                 valid_ids=0,
-                invalid_ids=gene_ids,
+                invalid_ids=tuple(gene_ids),
                 confidence=0.0,
                 mixed_types=False,
                 type_distribution={}
@@ -93,21 +111,34 @@ class GeneIDValidator:
         type_counts = Counter()
         valid_ids_set = set()
         invalid_ids = []
+        analyzed = 0
         
         for gene_id in sample_ids:
+            # IDs are compared case-insensitively; only uppercase when needed,
+            # most symbols are already uppercase
+            canonical_id = gene_id if gene_id.isupper() else gene_id.upper()
             matched = False
             for id_type, pattern in self.GENE_ID_PATTERNS.items():
-                if pattern.match(gene_id):
+                candidate = canonical_id if id_type in self.CASE_SENSITIVE_TYPES else gene_id
+                
+                if pattern.match(candidate):
                     type_counts[id_type] += 1
-                    valid_ids_set.add(gene_id)
+                    valid_ids_set.add(canonical_id)  # Case variants count once
                     matched = True
                     break  # First match wins
             
             if not matched:
                 invalid_ids.append(gene_id)
+            
+            analyzed += 1
+            if (adaptive and analyzed >= self.ADAPTIVE_MIN_SAMPLE
+                    and analyzed % self.ADAPTIVE_CHECK_INTERVAL == 0
+                    and type_counts
+                    and type_counts.most_common(1)[0][1] / analyzed > self.ADAPTIVE_DOMINANCE_THRESHOLD):
+                break  # Enough evidence to classify the column
         
         # Determine primary ID type and confidence
-        total_analyzed = len(sample_ids)
+        total_analyzed = analyzed
         
         if not type_counts:
             primary_type = "Unknown"
@@ -130,16 +161,45 @@ class GeneIDValidator:
             id_type=primary_type,
             total_ids=total_analyzed,
             valid_ids=len(valid_ids_set),
-            invalid_ids=invalid_ids[:20],  # Limit invalid examples
+            invalid_ids=tuple(invalid_ids[:20]),  # Limit invalid examples
             confidence=confidence,
             mixed_types=mixed_types,
             type_distribution=dict(type_counts)
         )
     
+    def _sample_series(self, gene_ids: pd.Series, sample_size: int) -> List[str]:
+        """
+        Collect the first non-empty IDs from a Series.
+        
+        The Series is cleaned in sample-sized windows so that whole-genome
+        columns only pay for the rows that are actually classified.
+        
+        Args:
+            gene_ids: Pandas Series containing gene identifiers
+            sample_size: Maximum number of IDs to collect
+            
+        Returns:
+            List of stripped, non-empty gene identifiers
+        """
+        sample_ids = []
+        window_size = max(sample_size, 1)
+        
+        for start in range(0, len(gene_ids), window_size):
+            window = gene_ids.iloc[start:start + window_size].dropna().astype('string').str.strip()
+            sample_ids.extend(window[window != ''].tolist())
+            if len(sample_ids) >= sample_size:
+                break
+        
+        return sample_ids[:sample_size]
+    
     def analyze_gene_column(self, gene_series: pd.Series) -> GeneIDAnalysis:
         """
         Perform comprehensive analysis of a gene ID column.
         
+        Only the dominant ID type matters here, so sampling stops early on
+        uniform columns; total_ids and the invalid-ID percentage then refer to
+        the IDs actually analyzed.
+        
         Args:
             gene_series: Pandas Series containing gene identifiers
             
@@ -147,8 +207,7 @@ class GeneIDValidator:
             GeneIDAnalysis with recommendations and warnings
         """
         # Validate the gene IDs
-        gene_ids = gene_series.dropna().astype(str).tolist()
-        validation_result = self.validate_gene_ids(gene_ids)
+        validation_result = self.validate_gene_ids(gene_series.dropna(), adaptive=True)
         
         # Generate recommendations and warnings
         recommendations = []
@@ -191,8 +250,8 @@ class GeneIDValidator:
             primary_type=primary_type,
             confidence=confidence,
             validation_result=validation_result,
-            recommendations=recommendations,
-            warnings=warnings
+            recommendations=tuple(recommendations),
+            warnings=tuple(warnings)
         )
     
     def get_confidence_level(self, confidence: float) -> str:
@@ -210,28 +269,39 @@ class GeneIDValidator:
     
     def get_type_description(self, id_type: str) -> str:
         """Get human-readable description of ID type."""
-        descriptions = {
-            'HGNC': 'HGNC Gene Symbols (e.g., TP53, BRCA1)',
-            'Ensembl': 'Ensembl Gene IDs (e.g., ENSG00000141510)',
-            'NCBI': 'NCBI Gene IDs (e.g., 7157, 672)',
-            'Probe': 'Microarray Probe IDs (e.g., 1007_s_at)',
-            'RefSeq': 'RefSeq Transcript IDs (e.g., NM_000546)',
-            'Unknown': 'Unrecognized ID format'
-        }
-        return descriptions.get(id_type, f"{id_type} identifiers")
+        return _type_description(id_type)
     
     def suggest_conversion(self, id_type: str) -> Optional[str]:
         """Suggest conversion strategy for unsupported ID types."""
         if id_type in self.supported_types:
             return None
             
-        suggestions = {
-            'Probe': 'Convert microarray probe IDs to gene symbols using platform annotation',
-            'RefSeq': 'Map RefSeq IDs to HGNC symbols or Ensembl Gene IDs',
-            'Unknown': 'Verify ID format and consider using standard gene identifiers'
-        }
-        
-        return suggestions.get(id_type, 'Consider converting to HGNC symbols or Ensembl Gene IDs')
+        return _conversion_suggestion(id_type)
+
+@lru_cache(maxsize=16)
+def _type_description(id_type: str) -> str:
+    """Get the human-readable description of an ID type."""
+    descriptions = {
+        'HGNC': 'HGNC Gene Symbols (e.g., TP53, BRCA1)',
+        'Ensembl': 'Ensembl Gene IDs (e.g., ENSG00000141510)',
+        'NCBI': 'NCBI Gene IDs (e.g., 7157, 672)',
+        'Probe': 'Microarray Probe IDs (e.g., 1007_s_at)',
+        'RefSeq': 'RefSeq Transcript IDs (e.g., NM_000546)',
+        'Unknown': 'Unrecognized ID format'
+    }
+    
+    return descriptions.get(id_type, f"{id_type} identifiers")
+
+@lru_cache(maxsize=16)
+def _conversion_suggestion(id_type: str) -> str:
+    """Get the conversion suggestion for an unsupported ID type."""
+    suggestions = {
+        'Probe': 'Convert microarray probe IDs to gene symbols using platform annotation',
+        'RefSeq': 'Map RefSeq IDs to HGNC symbols or Ensembl Gene IDs',
+        'Unknown': 'Verify ID format and consider using standard gene identifiers'
+    }
+    
+    return suggestions.get(id_type, 'Consider converting to HGNC symbols or Ensembl Gene IDs')
 
 # Global validator instance
 gene_id_validator = GeneIDValidator()
\ No newline at end of file
@@ -7,6 +7,32 @@ from typing import Dict, Set, List, Any
 
 logger = logging.getLogger(__name__)
 
+def _build_edge_dicts(edges: pd.DataFrame) -> List[Dict[str, Any]]:
+    """
+    Convert an edge DataFrame into Cytoscape.js edge dictionaries.
+    
+    Args:
+        edges: DataFrame with network edges (Source_KE, Target_KE, KER_ID)
+    
+    Returns:
+        List of Cytoscape.js edge dictionaries
+    """
+    # Build all edge IDs in one vectorized string operation
+    ker_ids = ('KER:' + edges['KER_ID'].astype(str)).tolist()
+    
+    return [
+        {
+            "data": {
+                "source": source_ke,
+                "target": target_ke,
+                "id": ker_id
+            }
+        }
+        for source_ke, target_ke, ker_id in zip(
+            edges['Source_KE'].tolist(), edges['Target_KE'].tolist(), ker_ids
+        )
+    ]
+
 def build_cytoscape_network(
     ke_list: Set[str],
     edges: pd.DataFrame, 
@@ -25,62 +51,47 @@ def build_cytoscape_network(
         ke_type_map: Mapping of KE IDs to types (MIE, intermediate, AO)
     
     Returns:
-        Dictionary with 'nodes' and 'edges' keys for Cytoscape.js
+        Dictionary with 'nodes' and 'edges' keys for Cytoscape.js, with nodes
+        in sorted KE order
     """
     logger.info("Building Cytoscape network structure")
     
-    # Build nodes
-    cy_nodes = []
-    for ke in ke_list:
-        # Get enrichment data for this KE
-        enrichment_row = enrichment_results[enrichment_results['KE'] == ke]
-        
-        if not enrichment_row.empty:
-            enrichment_row = enrichment_row.iloc[0]
-            odds_ratio = enrichment_row.get('odds_ratio', 0)
-            is_significant = enrichment_row.get('FDR', 1.0) < 0.05
-        else:
-            odds_ratio = 0
-            is_significant = False
-        
-        # Get KE metadata
-        label = ke_title_map.get(ke, ke)
-        ke_type = ke_type_map.get(ke, "intermediate")
-        
-        # Set CSS classes for styling
-        classes = []
-        if is_significant:
-            classes.append("significant")
-        
-        node_data = {
+    # Sort once for a deterministic node order, freeze once for membership tests
+    kes = sorted(ke_list)
+    ke_set = frozenset(kes)
+    
+    # Build nodes by joining enrichment results onto the KE list
+    nodes_df = pd.DataFrame({'KE': kes}).merge(
+        enrichment_results.reindex(columns=['KE', 'odds_ratio', 'FDR']).drop_duplicates('KE'),
+        on='KE',
+        how='left'
+    ).fillna({'odds_ratio': 0, 'FDR': 1.0})
+    
+    # Get KE metadata
+    nodes_df['label'] = nodes_df['KE'].map(ke_title_map).fillna(nodes_df['KE'])
+    nodes_df['ke_type'] = nodes_df['KE'].map(ke_type_map).fillna("intermediate")
+    
+    # Set CSS classes for styling
+    nodes_df['classes'] = (nodes_df['FDR'] < 0.05).map({True: "significant", False: ""})
+    
+    cy_nodes = [
+        {
             "data": {
                 "id": ke,
                 "label": label,
                 "logfc": odds_ratio,  # Using odds ratio as surrogate for color scaling
                 "ke_type": ke_type
             },
-            "classes": " ".join(classes)
+            "classes": classes
         }
-        
-        cy_nodes.append(node_data)
-    
-    # Build edges
-    cy_edges = []
-    for _, row in edges.iterrows():
-        source_ke = row['Source_KE']
-        target_ke = row['Target_KE']
-        ker_id = row['KER_ID']
-        
-        # Only include edges where both nodes exist in our KE list
-        if source_ke in ke_list and target_ke in ke_list:
-            edge_data = {
-                "data": {
-                    "source": source_ke,
-                    "target": target_ke,
-                    "id": f"KER:{ker_id}"
-                }
-            }
-            cy_edges.append(edge_data)
+        for ke, label, odds_ratio, ke_type, classes in nodes_df[
+            ['KE', 'label', 'odds_ratio', 'ke_type', 'classes']
+        ].itertuples(index=False, name=None)
+    ]
+    
+    # Build edges, only including edges where both nodes exist in our KE list
+    ke_edges = edges.loc[edges['Source_KE'].isin(ke_set) & edges['Target_KE'].isin(ke_set)]
+    cy_edges = _build_edge_dicts(ke_edges)
     
     network = {
         "nodes": cy_nodes,
@@ -111,7 +122,7 @@ def build_cytoscape_network_legacy(
     
     try:
         ker_df = pd.read_csv(ker_file)
-        edges = ker_df[ker_df['AOP_ID'] == aop_id]
+        edges = ker_df.loc[ker_df['AOP_ID'] == aop_id, ['Source_KE', 'Target_KE', 'KER_ID']]
         
         # Extract unique nodes from edges
         nodes = set(edges['Source_KE']) | set(edges['Target_KE'])
@@ -128,16 +139,7 @@ def build_cytoscape_network_legacy(
             cytoscape_nodes.append(node_data)
         
         # Build edges  
-        cytoscape_edges = []
-        for _, row in edges.iterrows():
-            edge_data = {
-                "data": {
-                    "source": row['Source_KE'],
-                    "target": row['Target_KE'], 
-                    "id": f"KER:{row['KER_ID']}"
-                }
-            }
-            cytoscape_edges.append(edge_data)
+        cytoscape_edges = _build_edge_dicts(edges)
         
         return {
             "nodes": cytoscape_nodes, 
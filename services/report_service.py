@@ -11,55 +11,552 @@ Generates comprehensive PDF and HTML reports containing:
 import os
 import json
 import base64
+import gzip
+import hashlib
 import logging
 import math
+import struct
+import numpy as np
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from datetime import datetime
-from typing import Dict, List, Any, Optional, Union
-from dataclasses import dataclass
+from typing import Dict, List, Any, Optional, Tuple, Union, BinaryIO
+from dataclasses import dataclass, field
+from functools import lru_cache
 from io import BytesIO
+from markupsafe import escape
+from importlib import metadata
+from importlib.util import find_spec
 import pandas as pd
+from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader
 
-try:
-    import plotly.graph_objects as go
-    import plotly.io as pio
-    PLOTLY_AVAILABLE = True
-except ImportError:
-    PLOTLY_AVAILABLE = False
-
-    
-try:
-    from weasyprint import HTML, CSS
-    from weasyprint.html import get_html_document
-    WEASYPRINT_AVAILABLE = True
-except (ImportError, OSError) as e:
-    WEASYPRINT_AVAILABLE = False
-    HTML = None
-    CSS = None
+# Plotting and WeasyPrint are heavy to import, so only check they are installed
+# here and import them on first use (see _plotly_io, _matplotlib_figure, _weasyprint)
+PLOTLY_AVAILABLE = find_spec('plotly') is not None
+MATPLOTLIB_AVAILABLE = find_spec('matplotlib') is not None
+WEASYPRINT_AVAILABLE = find_spec('weasyprint') is not None
 
 try:
     from reportlab.lib.pagesizes import letter, A4
     from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph, Spacer, PageBreak, Image
     from reportlab.platypus.flowables import HRFlowable
     from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-    from reportlab.lib.colors import Color, HexColor
+    from reportlab.lib.colors import HexColor
     from reportlab.lib.units import inch
     from reportlab.lib import colors
-    try:
-        from reportlab.graphics import renderPDF
-        from reportlab.graphics.shapes import Drawing
-        from svglib.svglib import renderSVG
-        SVG_SUPPORT = True
-    except ImportError:
-        SVG_SUPPORT = False
+    SVG_SUPPORT = find_spec('svglib') is not None
     REPORTLAB_AVAILABLE = True
 except ImportError:
     REPORTLAB_AVAILABLE = False
     SVG_SUPPORT = False
 
+try:
+    from PIL import Image as PILImage
+    PIL_AVAILABLE = True
+except ImportError:
+    PIL_AVAILABLE = False
+
 from config import Config, ExperimentMetadata
 
 logger = logging.getLogger(__name__)
 
+# Renders PDF plot images in the background while the rest of the story is assembled
+_IMAGE_EXECUTOR = ThreadPoolExecutor(max_workers=2, thread_name_prefix='report-image')
+
+
+@lru_cache(maxsize=1)
+def _plotly_io():
+    """Import plotly.io on first use, serializing figures with orjson when installed."""
+    import plotly.io as pio
+    try:
+        import orjson  # noqa: F401
+        pio.json.config.default_engine = 'orjson'
+    except ImportError:
+        pass
+    return pio
+
+
+@lru_cache(maxsize=1)
+def _plotly_cdn_script() -> str:
+    """Build the plotly.js CDN <script> tags once.
+    
+    ``to_html(include_plotlyjs='cdn')`` re-reads and hashes the bundled
+    plotly.js for the integrity attribute on every call.
+    """
+    from plotly.offline import get_plotlyjs, get_plotlyjs_version
+    digest = hashlib.sha256(get_plotlyjs().encode('utf-8')).digest()
+    return (
+        "<script>window.PlotlyConfig = {MathJaxConfig: 'local'};</script>"
+        f'<script charset="utf-8" src="https://cdn.plot.ly/plotly-{get_plotlyjs_version()}.min.js" '
+        f'integrity="sha256-{base64.b64encode(digest).decode("ascii")}" crossorigin="anonymous"></script>'
+    )
+
+
+@lru_cache(maxsize=1)
+def _matplotlib_figure():
+    """Import Matplotlib's Figure class on first use."""
+    from matplotlib.figure import Figure
+    return Figure
+
+
+@lru_cache(maxsize=1)
+def _weasyprint():
+    """Import WeasyPrint on first use (raises OSError if its system libraries are missing)."""
+    import weasyprint
+    return weasyprint
+
+# HTML report template environment, compiled templates are cached for the process lifetime
+_TEMPLATE_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'templates')
+# (block tags drop their own line so the shell adds no blank lines around each section);
+# bytecode is also cached in a per-user temp directory so new worker processes skip compiling
+_JINJA_ENV = Environment(loader=FileSystemLoader(_TEMPLATE_DIR), auto_reload=False, cache_size=400,
+                         trim_blocks=True, lstrip_blocks=True,
+                         bytecode_cache=FileSystemBytecodeCache())
+
+# Static CSS for reports, read once from static/css/report.css
+_STATIC_DIR = os.path.join(os.path.dirname(_TEMPLATE_DIR), 'static')
+_REPORT_CSS_PATH = os.path.join(_STATIC_DIR, 'css', 'report.css')
+with open(_REPORT_CSS_PATH, encoding='utf-8') as _css_file:
+    _REPORT_CSS = _css_file.read()
+
+# HTML section templates, parsed once and filled with escaped values via str.format_map
+_HEADER_TMPL = """
+        <header class="report-header">
+            <h1>Molecular AOP Analysis Report</h1>
+            <div class="report-meta">
+                <p><strong>Dataset:</strong> {dataset_id}</p>
+                <p><strong>Generated:</strong> {generated}</p>
+            </div>
+        </header>
+        """
+
+_METADATA_TMPL = """
+        <section class="metadata-section">
+            <h2>Experiment Information</h2>
+            <div class="metadata-grid">
+                <div class="metadata-item">
+                    <label>Dataset ID:</label>
+                    <span>{dataset_id}</span>
+                </div>
+                <div class="metadata-item">
+                    <label>Stressor/Treatment:</label>
+                    <span>{stressor}</span>
+                </div>
+                <div class="metadata-item">
+                    <label>Dosing Information:</label>
+                    <span>{dosing}</span>
+                </div>
+                <div class="metadata-item">
+                    <label>Owner/Contact:</label>
+                    <span>{owner}</span>
+                </div>
+                <div class="metadata-item">
+                    <label>Upload Time:</label>
+                    <span>{upload_timestamp}</span>
+                </div>
+                {description}
+            </div>
+        </section>
+        """
+
+_METADATA_FIELDS = ('dataset_id', 'stressor', 'dosing', 'owner', 'upload_timestamp')
+
+_DESCRIPTION_TMPL = '<div class="metadata-item full-width"><label>Description:</label><p>{description}</p></div>'
+
+_STAT_ITEM_TMPL = """
+                <div class="stat-item">
+                    <label>{label}:</label>
+                    <span>{value}</span>
+                </div>"""
+
+_INPUT_SUMMARY_TMPL = """
+        <section class="input-summary">
+            <h2>Input Data Summary</h2>
+            <div class="summary-stats">{stat_items}
+            </div>
+        </section>
+        """
+
+_ANALYSIS_PARAMS_TMPL = """
+        <section class="analysis-params">
+            <h2>Analysis Settings</h2>
+            <div class="params-grid">
+                <div class="param-item">
+                    <label>Selected AOP:</label>
+                    <span>{aop_label} (ID: {aop_id})</span>
+                </div>
+                <div class="param-item">
+                    <label>Log2FC Threshold:</label>
+                    <span>{logfc_threshold}</span>
+                </div>
+                <div class="param-item">
+                    <label>P-value Cutoff:</label>
+                    <span>{pval_cutoff}</span>
+                </div>
+                <div class="param-item">
+                    <label>Gene ID Column:</label>
+                    <span>{id_column}</span>
+                </div>
+                <div class="param-item">
+                    <label>Log2FC Column:</label>
+                    <span>{fc_column}</span>
+                </div>
+                <div class="param-item">
+                    <label>P-value Column:</label>
+                    <span>{pval_column}</span>
+                </div>
+            </div>
+        </section>
+        """
+
+_VOLCANO_SECTION_TMPL = """
+            <section class="volcano-section">
+                <h2>Volcano Plot</h2>
+                <div class="plot-description">
+                    <p>Volcano plot showing log2 fold change vs. -log10(p-value) for all genes. 
+                    Red points indicate significantly upregulated genes, blue points show significantly downregulated genes.</p>
+                </div>
+                <div class="plot-container">
+                    {plot}
+                </div>
+            </section>
+            """
+
+# Empty plot div plus its figure JSON, drawn by the page script once scrolled into view
+_LAZY_PLOT_TMPL = (
+    '<div id="{div_id}" class="plotly-graph-div" data-figure="{div_id}-figure"></div>'
+    '<script type="application/json" id="{div_id}-figure">{figure}</script>'
+)
+
+# Static volcano image used in place of the Plotly div when the HTML is rendered to PDF
+_VOLCANO_IMAGE_TMPL = '<img src="data:image/png;base64,{data}" alt="Volcano plot">'
+
+# Fixed sections returned as-is when there is nothing to render
+_VOLCANO_UNAVAILABLE_HTML = """
+            <section class="volcano-section">
+                <h2>Volcano Plot</h2>
+                <p class="note">Volcano plot visualization not available.</p>
+            </section>
+            """
+
+_VOLCANO_ERROR_HTML = """
+            <section class="volcano-section">
+                <h2>Volcano Plot</h2>
+                <p class="note">Error generating volcano plot visualization.</p>
+            </section>
+            """
+
+_ENRICHMENT_UNAVAILABLE_HTML = """
+            <section class="enrichment-section">
+                <h2>Key Event Enrichment Results</h2>
+                <p class="note">No enrichment results available.</p>
+            </section>
+            """
+
+_ENRICHMENT_ROW_TMPL = """
+            <tr class="{row_class}">
+                <td>{ke_id}</td>
+                <td>{title}</td>
+                <td>{overlap}</td>
+                <td>{ke_size}</td>
+                <td>{p_value}</td>
+                <td>{fdr}</td>
+                <td>{odds_ratio}</td>
+            </tr>
+            """
+
+_ENRICHMENT_SECTION_TMPL = """
+        <section class="enrichment-section">
+            <h2>Key Event Enrichment Results</h2>
+            <p class="section-description">
+                Statistical enrichment analysis of significantly differentially expressed genes 
+                against Key Event gene sets. Results are ranked by adjusted p-value.
+            </p>
+            
+            <div class="table-container">
+                <table class="enrichment-table">
+                    <thead>
+                        <tr>
+                            <th>KE ID</th>
+                            <th>Key Event Title</th>
+                            <th># Overlap</th>
+                            <th>KE Gene Count</th>
+                            <th>P-value</th>
+                            <th>FDR</th>
+                            <th>Odds Ratio</th>
+                        </tr>
+                    </thead>
+                    <tbody>
+                        {table_rows}
+                    </tbody>
+                </table>
+            </div>
+            
+            <div class="results-summary">
+                <p><strong>Total Key Events tested:</strong> {total}</p>
+                <p><strong>Significantly enriched (FDR < 0.05):</strong> {significant}</p>
+            </div>
+        </section>
+        """
+
+_VERSION_ITEM_TMPL = "<li><strong>{package}:</strong> {version}</li>"
+
+_VERSIONS_TMPL = '<div class="versions"><h3>Software Versions</h3><ul>{version_items}</ul></div>'
+
+_SYSTEM_INFO_TMPL = """
+        <section class="system-info">
+            <h2>System Information</h2>
+            <div class="info-grid">
+                <div class="info-item">
+                    <label>Analysis Date:</label>
+                    <span>{timestamp} UTC</span>
+                </div>
+                <div class="info-item">
+                    <label>Application:</label>
+                    <span>Molecular AOP Analyser</span>
+                </div>
+            </div>
+            
+            {versions}
+        </section>
+        """
+
+
+# WeasyPrint output options: recompress embedded images and skip HTML presentational hints
+_WEASYPRINT_PDF_OPTIONS = {
+    'optimize_images': True,
+    'jpeg_quality': 85,
+    'dpi': 150,
+    'presentational_hints': False,
+    'uncompressed_pdf': False,
+}
+
+
+@lru_cache(maxsize=1)
+def _weasyprint_font_config():
+    """Create a single WeasyPrint font configuration so system fonts are probed once."""
+    from weasyprint.text.fonts import FontConfiguration
+    return FontConfiguration()
+
+
+@lru_cache(maxsize=1)
+def _weasyprint_stylesheet():
+    """Parse the report stylesheet for WeasyPrint once and reuse it across renders."""
+    return _weasyprint().CSS(filename=_REPORT_CSS_PATH, font_config=_weasyprint_font_config())
+
+# ReportLab house styles, built once at import rather than per PDF
+if REPORTLAB_AVAILABLE:
+    _PDF_STYLES = getSampleStyleSheet()
+    _PDF_PRIMARY_COLOR = HexColor('#307BBF')
+    _PDF_DARK_COLOR = HexColor('#29235C')
+    _PDF_ACCENT_COLOR = HexColor('#E6007E')
+    _PDF_STRIPE_COLOR = HexColor('#f9f9f9')
+    _PDF_HIGHLIGHT_COLOR = colors.lightyellow
+    
+    # Fixed table row height (12pt leading plus 3pt top/bottom padding); passing
+    # rowHeights explicitly skips ReportLab's per-cell height measurement
+    _PDF_ROW_HEIGHT = 18
+    
+    # Static table styles, shared by every PDF; setStyle copies the commands
+    _PDF_SUMMARY_TABLE_STYLE = TableStyle([
+        ('BACKGROUND', (0, 0), (-1, 0), _PDF_PRIMARY_COLOR),
+        ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+        ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+        ('FONTSIZE', (0, 0), (-1, 0), 12),
+        ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
+        ('BACKGROUND', (0, 1), (-1, -1), colors.beige),
+        ('GRID', (0, 0), (-1, -1), 1, colors.black)
+    ])
+    
+    _PDF_ENRICHMENT_TABLE_STYLE = TableStyle([
+        ('BACKGROUND', (0, 0), (-1, 0), _PDF_PRIMARY_COLOR),
+        ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+        ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+        ('FONTSIZE', (0, 0), (-1, 0), 9),
+        ('FONTSIZE', (0, 1), (-1, -1), 8),
+        ('BOTTOMPADDING', (0, 0), (-1, 0), 8),
+        ('GRID', (0, 0), (-1, -1), 1, colors.black),
+        ('VALIGN', (0, 0), (-1, -1), 'TOP'),
+    ])
+    
+    _PDF_STATS_TABLE_STYLE = TableStyle([
+        # Header styling
+        ('BACKGROUND', (0, 0), (-1, 0), _PDF_PRIMARY_COLOR),
+        ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
+        ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+        ('ALIGN', (1, 0), (1, -1), 'RIGHT'),  # Right-align values
+        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+        ('FONTSIZE', (0, 0), (-1, 0), 12),
+        
+        # Data styling
+        ('FONTNAME', (0, 1), (-1, -1), 'Helvetica'),
+        ('FONTSIZE', (0, 1), (-1, -1), 10),
+        ('GRID', (0, 0), (-1, -1), 1, colors.black),
+        ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+        
+        # Alternating row colors
+        ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, _PDF_STRIPE_COLOR])
+    ])
+    
+    # Borderless list tables (legends, system information) span the A4 frame
+    # inside the 1 inch side margins; rows are one 12pt line plus 1pt padding
+    _PDF_FRAME_WIDTH = A4[0] - 2 * inch
+    _PDF_LIST_ROW_HEIGHT = 14
+    _PDF_LIST_STYLE = TableStyle([
+        ('LEFTPADDING', (0, 0), (-1, -1), 0),
+        ('TOPPADDING', (0, 0), (-1, -1), 1),
+        ('BOTTOMPADDING', (0, 0), (-1, -1), 1),
+        ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+        ('FONTNAME', (0, 0), (-1, -1), 'Helvetica'),
+        ('FONTSIZE', (0, 0), (-1, -1), 10),
+        ('TEXTCOLOR', (0, 0), (-1, -1), _PDF_DARK_COLOR),
+    ])
+
+    _PDF_TITLE_STYLE = ParagraphStyle(
+        'CustomTitle',
+        parent=_PDF_STYLES['Heading1'],
+        fontSize=24,
+        spaceAfter=30,
+        textColor=_PDF_DARK_COLOR,
+        alignment=1  # Center
+    )
+
+    _PDF_HEADING_STYLE = ParagraphStyle(
+        'CustomHeading',
+        parent=_PDF_STYLES['Heading2'],
+        fontSize=16,
+        spaceAfter=12,
+        textColor=_PDF_PRIMARY_COLOR,
+        borderWidth=1,
+        borderColor=_PDF_PRIMARY_COLOR,
+        borderPadding=5
+    )
+
+    _PDF_NORMAL_STYLE = ParagraphStyle(
+        'CustomNormal',
+        parent=_PDF_STYLES['Normal'],
+        fontSize=10,
+        textColor=_PDF_DARK_COLOR
+    )
+
+# PDF legend bullets, one table row each; the volcano items are filled with %-formatting
+_PDF_VOLCANO_LEGEND_ITEMS = (
+    '<font color="red">Red points</font>: Significantly upregulated genes (p &lt; %(pval)s, log2FC ≥ %(fc)s)',
+    '<font color="blue">Blue points</font>: Significantly downregulated genes (p &lt; %(pval)s, log2FC ≤ -%(fc)s)',
+    '<font color="green">Green points</font>: Significant but low fold change',
+    '<font color="gray">Gray points</font>: Non-significant genes',
+    'Horizontal dashed line: p-value cutoff (%(pval)s)',
+    'Vertical dotted lines: log2FC thresholds (±%(fc)s)',
+)
+
+_PDF_NETWORK_LEGEND_ITEMS = (
+    '<font color="#b3e6b3">Green circles</font>: Molecular Initiating Events (MIEs)',
+    '<font color="#ffd9b3">Orange circles</font>: Intermediate Key Events',
+    '<font color="#f4b3b3">Pink circles</font>: Adverse Outcomes (AOs)',
+    '<font color="red">Red border</font>: Significantly enriched Key Events (FDR &lt; 0.05)',
+    'Arrows indicate causal relationships between Key Events',
+)
+
+
+@lru_cache(maxsize=128)
+def _parsed_paragraph(text: str, style: Any) -> Tuple[Any, list]:
+    """Parse paragraph markup once per (text, style) and return its style and fragments."""
+    paragraph = Paragraph(text, style)
+    return paragraph.style, paragraph.frags
+
+
+def _paragraph(text: str, style: Any) -> 'Paragraph':
+    """Create a Paragraph for static or repeated text without re-running the markup parser."""
+    parsed_style, frags = _parsed_paragraph(text, style)
+    return Paragraph(text, parsed_style, frags=frags)
+
+
+def _legend_table(title: str, items: Tuple[str, ...]) -> 'Table':
+    """Lay out a PDF legend as a one-column table with one bullet per row."""
+    rows = [[_paragraph(f'<b>{title}</b>', _PDF_NORMAL_STYLE)]]
+    rows += [[_paragraph('• ' + item, _PDF_NORMAL_STYLE)] for item in items]
+    table = Table(rows, colWidths=[_PDF_FRAME_WIDTH], rowHeights=[_PDF_LIST_ROW_HEIGHT] * len(rows))
+    table.setStyle(_PDF_LIST_STYLE)
+    return table
+
+
+_PNG_SIGNATURE = b'\x89PNG\r\n\x1a\n'
+
+
+def _image_size(img_bytes: bytes) -> Tuple[int, int]:
+    """Return (width, height) of an encoded image.
+    
+    PNG dimensions are read straight from the IHDR chunk header; other
+    formats are opened with PIL.
+    """
+    if img_bytes[:8] == _PNG_SIGNATURE and len(img_bytes) >= 24:
+        return struct.unpack('>II', img_bytes[16:24])
+    if not PIL_AVAILABLE:
+        raise RuntimeError("Pillow is required to read non-PNG image dimensions")
+    with PILImage.open(BytesIO(img_bytes)) as pil_img:
+        return pil_img.size
+
+
+def _add_image(story: list, buffers: List[BytesIO], img_bytes: bytes,
+               width: float, height: float) -> None:
+    """Append an encoded image to a ReportLab story.
+    
+    ReportLab reads image data lazily while the document is built, so the
+    backing buffer is recorded in ``buffers`` for the caller to close once
+    ``doc.build`` has finished.
+    """
+    buf = BytesIO(img_bytes)
+    buffers.append(buf)
+    story.append(Image(buf, width=width, height=height))
+
+
+def _format_pvalues(values: pd.Series) -> List[str]:
+    """Format p-values, using scientific notation below 0.001."""
+    return np.where(
+        values < 0.001, values.map('{:.2e}'.format), values.map('{:.4f}'.format)
+    ).tolist()
+
+
+def _format_odds_ratio(value: Any) -> str:
+    """Format an odds ratio, passing through non-numeric markers such as 'NA'."""
+    try:
+        return format(value, '.2f')
+    except (TypeError, ValueError):
+        return str(value)
+
+
+def _format_odds_ratios(values: pd.Series) -> pd.Series:
+    """Format a column of odds ratios, formatting numeric columns without per-value fallbacks."""
+    if pd.api.types.is_numeric_dtype(values):
+        return values.map('{:.2f}'.format)
+    return values.map(_format_odds_ratio)
+
+
+def _typed_array(values: np.ndarray) -> Dict[str, str]:
+    """Encode a numeric array in plotly.js's base64 typed-array form ({dtype, bdata})."""
+    values = np.ascontiguousarray(values, dtype=values.dtype.newbyteorder('<'))
+    return {'dtype': values.dtype.str[1:], 'bdata': base64.b64encode(values.tobytes()).decode('ascii')}
+
+
+# Volcano point colors: up, down, significant with low fold change, not significant
+_VOLCANO_PALETTE = ('red', 'blue', 'green', 'lightgray')
+_VOLCANO_PALETTE_ARRAY = np.array(_VOLCANO_PALETTE)
+
+# Discrete Plotly colorscale mapping the int8 color codes 0-3 onto _VOLCANO_PALETTE
+_VOLCANO_MARKER_SCALE = {
+    'colorscale': [
+        [bound, color]
+        for i, color in enumerate(_VOLCANO_PALETTE)
+        for bound in (i / len(_VOLCANO_PALETTE), (i + 1) / len(_VOLCANO_PALETTE))
+    ],
+    'cmin': 0,
+    'cmax': len(_VOLCANO_PALETTE) - 1,
+    'showscale': False,
+}
+
+
 @dataclass
 class ReportData:
     """Container for all data needed to generate a comprehensive report."""
@@ -92,19 +589,33 @@ class ReportData:
     analysis_timestamp: datetime = None
     software_versions: Optional[Dict[str, str]] = None
     
+    # Pre-formatted values shared by the HTML and PDF renderers (see ReportGenerator._build_sections)
+    _sections: Optional[Dict[str, Any]] = field(default=None, init=False, repr=False, compare=False)
+    _timestamp_str: str = field(default='', init=False, repr=False, compare=False)
+    
     def __post_init__(self):
-        """Set analysis timestamp if not provided."""
+        """Set analysis timestamp if not provided and format it once for all renderers."""
         if self.analysis_timestamp is None:
             self.analysis_timestamp = datetime.now()
+        self._timestamp_str = self.analysis_timestamp.strftime('%Y-%m-%d %H:%M:%S')
 
 
 class ReportGenerator:
     """Main report generation class supporting HTML and PDF formats."""
     
+    # Number of enrichment results listed in the HTML and PDF tables
+    ENRICHMENT_TABLE_ROWS = 20
+    PDF_ENRICHMENT_TABLE_ROWS = 15
+    
+    # Volcano plot size in the PDF (inches) and the resolution its PNG is rendered at
+    PDF_VOLCANO_SIZE_IN = (5, 3.3)
+    PDF_IMAGE_DPI = 144
+    
     def __init__(self):
         """Initialize the report generator."""
         self.template_dir = "templates"
         self.static_dir = "static"
+        self._template = _JINJA_ENV.get_template("report.html")
         
     def generate_html_report(self, report_data: ReportData) -> str:
         """Generate an HTML report from the provided data.
@@ -121,14 +632,27 @@ class ReportGenerator:
             logger.error(f"Failed to generate HTML report: {e}")
             raise
     
-    def generate_pdf_report(self, report_data: ReportData) -> bytes:
+    def generate_html_report_gzip(self, report_data: ReportData) -> bytes:
+        """Generate an HTML report compressed for a ``Content-Encoding: gzip`` response.
+        
+        Args:
+            report_data: Complete report data container
+            
+        Returns:
+            Gzip-compressed UTF-8 HTML
+        """
+        return gzip.compress(self.generate_html_report(report_data).encode('utf-8'), compresslevel=6)
+    
+    def generate_pdf_report(self, report_data: ReportData, out: Optional[BinaryIO] = None) -> Optional[bytes]:
         """Generate a PDF report from the provided data.
         
         Args:
             report_data: Complete report data container
+            out: Optional writable binary stream; when given, the PDF is written
+                to it directly instead of being returned
             
         Returns:
-            PDF content as bytes
+            PDF content as bytes, or None when written to ``out``
             
         Raises:
             RuntimeError: If no PDF generation method is available
@@ -137,7 +661,7 @@ class ReportGenerator:
         if REPORTLAB_AVAILABLE:
             try:
                 logger.info("Generating PDF using ReportLab")
-                return self._generate_reportlab_pdf(report_data)
+                return self._generate_reportlab_pdf(report_data, out)
             except Exception as e:
                 logger.warning(f"ReportLab PDF generation failed: {e}")
                 # Fall through to WeasyPrint if available
@@ -146,9 +670,22 @@ class ReportGenerator:
         if WEASYPRINT_AVAILABLE:
             try:
                 logger.info("Falling back to WeasyPrint for PDF generation")
-                html_content = self._build_html_content(report_data)
-                html_doc = HTML(string=html_content)
-                pdf_bytes = html_doc.write_pdf(optimize_images=True)
+                # Stylesheet is passed pre-parsed rather than inlined into the HTML
+                html_content = self._build_html_content(report_data, inline_css=False, for_pdf=True)
+                # A local base_url keeps any relative URL from being fetched remotely
+                html_doc = _weasyprint().HTML(string=html_content, base_url=_STATIC_DIR)
+                pdf_options = dict(
+                    _WEASYPRINT_PDF_OPTIONS,
+                    stylesheets=[_weasyprint_stylesheet()],
+                    font_config=_weasyprint_font_config()
+                )
+                
+                if out is not None:
+                    html_doc.write_pdf(target=out, **pdf_options)
+                    logger.info("WeasyPrint PDF written to output stream")
+                    return None
+                
+                pdf_bytes = html_doc.write_pdf(**pdf_options)
                 
                 if not pdf_bytes:
                     raise RuntimeError("WeasyPrint returned empty content")
@@ -168,292 +705,320 @@ class ReportGenerator:
         logger.error(error_msg)
         raise RuntimeError(error_msg)
     
-    def _build_html_content(self, report_data: ReportData) -> str:
-        """Build the complete HTML report content.
+    def generate_pdf_reports_batch(self, report_data_list: List[ReportData],
+                                   max_workers: Optional[int] = None) -> List[bytes]:
+        """Generate several PDF reports in parallel worker processes.
+        
+        PDF layout is CPU-bound Python that holds the GIL, so only separate
+        processes render concurrently. Workers are spawned rather than forked
+        so they do not inherit this process's image-rendering threads.
         
         Args:
-            report_data: Report data container
+            report_data_list: Report data containers to render
+            max_workers: Worker process count (defaults to the CPU count)
             
         Returns:
-            Complete HTML string
+            PDF content as bytes, in the order of ``report_data_list``
         """
-        # Generate individual sections
-        header_html = self._generate_header(report_data)
-        metadata_html = self._generate_metadata_section(report_data)
-        input_summary_html = self._generate_input_summary(report_data)
-        analysis_params_html = self._generate_analysis_parameters(report_data)
-        volcano_html = self._generate_volcano_section(report_data)
-        enrichment_html = self._generate_enrichment_section(report_data)
-        system_info_html = self._generate_system_info(report_data)
+        if len(report_data_list) <= 1:
+            return [self.generate_pdf_report(report_data) for report_data in report_data_list]
         
-        # Combine all sections
-        full_html = f"""
-        <!DOCTYPE html>
-        <html lang="en">
-        <head>
-            <meta charset="UTF-8">
-            <meta name="viewport" content="width=device-width, initial-scale=1.0">
-            <title>Molecular AOP Analysis Report</title>
-            <style>
-                {self._get_report_css()}
-            </style>
-        </head>
-        <body>
-            {header_html}
-            <div class="container">
-                {metadata_html}
-                {input_summary_html}
-                {analysis_params_html}
-                {volcano_html}
-                {enrichment_html}
-                {system_info_html}
-            </div>
-        </body>
-        </html>
+        with ProcessPoolExecutor(
+            max_workers=max_workers, mp_context=multiprocessing.get_context('spawn')
+        ) as executor:
+            return list(executor.map(_render_pdf_worker, report_data_list))
+    
+    def generate_html_reports_batch(self, report_data_list: List[ReportData],
+                                    max_workers: Optional[int] = None) -> List[str]:
+        """Generate several HTML reports in parallel worker processes.
+        
+        Args:
+            report_data_list: Report data containers to render
+            max_workers: Worker process count (defaults to the CPU count)
+            
+        Returns:
+            HTML strings, in the order of ``report_data_list``
         """
+        if len(report_data_list) <= 1:
+            return [self.generate_html_report(report_data) for report_data in report_data_list]
         
-        return full_html
+        with ProcessPoolExecutor(
+            max_workers=max_workers, mp_context=multiprocessing.get_context('spawn')
+        ) as executor:
+            return list(executor.map(_render_html_worker, report_data_list))
     
-    def _generate_header(self, report_data: ReportData) -> str:
-        """Generate report header section."""
-        return f"""
-        <header class="report-header">
-            <h1>Molecular AOP Analysis Report</h1>
-            <div class="report-meta">
-                <p><strong>Dataset:</strong> {report_data.metadata.get('dataset_id', 'N/A')}</p>
-                <p><strong>Generated:</strong> {report_data.analysis_timestamp.strftime('%Y-%m-%d %H:%M:%S')}</p>
-            </div>
-        </header>
+    def _build_sections(self, report_data: ReportData) -> Dict[str, Any]:
+        """Pre-format the values shared by the HTML and PDF renderers.
+        
+        The result is cached on the report data, so rendering both formats
+        from the same ReportData only formats it once.
+        
+        Args:
+            report_data: Report data container
+            
+        Returns:
+            Dict with the dataset header values, input summary rows and the
+            formatted top enrichment rows
         """
+        if report_data._sections is not None:
+            return report_data._sections
+        
+        # Load the top results once and format each column as a whole
+        top = pd.DataFrame(
+            report_data.enrichment_results[:self.ENRICHMENT_TABLE_ROWS],
+            columns=['KE', 'Title', 'num_overlap', 'total_KE_genes_in_dataset', 'p_value', 'FDR', 'odds_ratio']
+        )
+        pvals = pd.to_numeric(top['p_value'], errors='coerce').fillna(0)
+        raw_fdrs = pd.to_numeric(top['FDR'], errors='coerce')
+        fdrs = raw_fdrs.fillna(pvals)
+        
+        enrichment_rows = [
+            {
+                'ke_id': ke_id,
+                'title': title,
+                'overlap': overlap,
+                'ke_size': ke_size,
+                'p_value': p_fmt,
+                'fdr': fdr_fmt,
+                'odds_ratio': odds_fmt,
+                'significant': significant,
+                'fdr_significant': fdr_significant,
+            }
+            for ke_id, title, overlap, ke_size, p_fmt, fdr_fmt, odds_fmt, significant, fdr_significant in zip(
+                top['KE'].fillna('N/A'),
+                top['Title'].fillna('N/A'),
+                top['num_overlap'].fillna(0).astype(int),
+                top['total_KE_genes_in_dataset'].fillna(0).astype(int),
+                _format_pvalues(pvals),
+                _format_pvalues(fdrs),
+                _format_odds_ratios(top['odds_ratio'].fillna(0)),
+                # The HTML table falls back to the p-value when FDR is missing,
+                # the PDF table only highlights rows with a reported FDR
+                (fdrs < 0.05).tolist(),
+                (raw_fdrs.fillna(1) < 0.05).tolist(),
+            )
+        ]
+        
+        report_data._sections = {
+            'dataset_id': report_data.metadata.get('dataset_id', 'N/A'),
+            'generated': report_data._timestamp_str,
+            'input_summary': [
+                ('Filename', report_data.filename),
+                ('Total Genes', f"{report_data.gene_count:,}"),
+                ('Significant Genes', f"{report_data.significant_genes:,}"),
+                ('Gene ID Type', report_data.id_type),
+            ],
+            'enrichment_rows': enrichment_rows,
+            'enrichment_total': len(report_data.enrichment_results),
+            'enrichment_significant': sum(
+                1 for r in report_data.enrichment_results if r.get('FDR', 1) < 0.05
+            ),
+        }
+        return report_data._sections
     
-    def _generate_metadata_section(self, report_data: ReportData) -> str:
-        """Generate experiment metadata section."""
-        metadata = report_data.metadata
+    def _build_html_content(self, report_data: ReportData, inline_css: bool = True,
+                            for_pdf: bool = False) -> str:
+        """Build the complete HTML report content.
         
-        return f"""
-        <section class="metadata-section">
-            <h2>Experiment Information</h2>
-            <div class="metadata-grid">
-                <div class="metadata-item">
-                    <label>Dataset ID:</label>
-                    <span>{metadata.get('dataset_id', 'N/A')}</span>
-                </div>
-                <div class="metadata-item">
-                    <label>Stressor/Treatment:</label>
-                    <span>{metadata.get('stressor', 'N/A')}</span>
-                </div>
-                <div class="metadata-item">
-                    <label>Dosing Information:</label>
-                    <span>{metadata.get('dosing', 'N/A')}</span>
-                </div>
-                <div class="metadata-item">
-                    <label>Owner/Contact:</label>
-                    <span>{metadata.get('owner', 'N/A')}</span>
-                </div>
-                <div class="metadata-item">
-                    <label>Upload Time:</label>
-                    <span>{metadata.get('upload_timestamp', 'N/A')}</span>
-                </div>
-                {f'<div class="metadata-item full-width"><label>Description:</label><p>{metadata.get("description", "N/A")}</p></div>' if metadata.get('description') else ''}
-            </div>
-        </section>
+        Args:
+            report_data: Report data container
+            inline_css: Embed the report stylesheet in a <style> block
+            for_pdf: Embed the volcano plot as a static PNG instead of the
+                interactive Plotly script, which WeasyPrint cannot run
+            
+        Returns:
+            Complete HTML string
         """
+        # Generate individual sections
+        header_html = self._generate_header(report_data)
+        metadata_html = self._generate_metadata_section(report_data)
+        input_summary_html = self._generate_input_summary(report_data)
+        analysis_params_html = self._generate_analysis_parameters(report_data)
+        volcano_html = self._generate_volcano_section(report_data, static=for_pdf)
+        enrichment_html = self._generate_enrichment_section(report_data)
+        system_info_html = self._generate_system_info(report_data)
+        
+        return self._template.render(
+            css=self._get_report_css() if inline_css else None,
+            lazy_plots=not for_pdf,
+            header=header_html,
+            sections=[
+                metadata_html,
+                input_summary_html,
+                analysis_params_html,
+                volcano_html,
+                enrichment_html,
+                system_info_html,
+            ]
+        )
+    
+    def _generate_header(self, report_data: ReportData) -> str:
+        """Generate report header section."""
+        sections = self._build_sections(report_data)
+        return _HEADER_TMPL.format_map({
+            'dataset_id': escape(sections['dataset_id']),
+            'generated': sections['generated'],
+        })
+    
+    def _generate_metadata_section(self, report_data: ReportData) -> str:
+        """Generate experiment metadata section."""
+        metadata = report_data.metadata
+        
+        # Snapshot each field once; missing fields show as N/A
+        values = {key: escape(metadata.get(key, 'N/A')) for key in _METADATA_FIELDS}
+        description = metadata.get('description')
+        values['description'] = (
+            _DESCRIPTION_TMPL.format(description=escape(description)) if description else ''
+        )
+        
+        return _METADATA_TMPL.format_map(values)
     
     def _generate_input_summary(self, report_data: ReportData) -> str:
         """Generate input data summary section."""
-        return f"""
-        <section class="input-summary">
-            <h2>Input Data Summary</h2>
-            <div class="summary-stats">
-                <div class="stat-item">
-                    <label>Filename:</label>
-                    <span>{report_data.filename}</span>
-                </div>
-                <div class="stat-item">
-                    <label>Total Genes:</label>
-                    <span>{report_data.gene_count:,}</span>
-                </div>
-                <div class="stat-item">
-                    <label>Significant Genes:</label>
-                    <span>{report_data.significant_genes:,}</span>
-                </div>
-                <div class="stat-item">
-                    <label>Gene ID Type:</label>
-                    <span>{report_data.id_type}</span>
-                </div>
-            </div>
-        </section>
-        """
+        stat_items = "".join([
+            _STAT_ITEM_TMPL.format(label=label, value=escape(value))
+            for label, value in self._build_sections(report_data)['input_summary']
+        ])
+        return _INPUT_SUMMARY_TMPL.format(stat_items=stat_items)
     
     def _generate_analysis_parameters(self, report_data: ReportData) -> str:
         """Generate analysis parameters section."""
-        return f"""
-        <section class="analysis-params">
-            <h2>Analysis Settings</h2>
-            <div class="params-grid">
-                <div class="param-item">
-                    <label>Selected AOP:</label>
-                    <span>{report_data.aop_label} (ID: {report_data.aop_id})</span>
-                </div>
-                <div class="param-item">
-                    <label>Log2FC Threshold:</label>
-                    <span>{report_data.logfc_threshold}</span>
-                </div>
-                <div class="param-item">
-                    <label>P-value Cutoff:</label>
-                    <span>{report_data.pval_cutoff}</span>
-                </div>
-                <div class="param-item">
-                    <label>Gene ID Column:</label>
-                    <span>{report_data.id_column}</span>
-                </div>
-                <div class="param-item">
-                    <label>Log2FC Column:</label>
-                    <span>{report_data.fc_column}</span>
-                </div>
-                <div class="param-item">
-                    <label>P-value Column:</label>
-                    <span>{report_data.pval_column}</span>
-                </div>
-            </div>
-        </section>
-        """
+        return _ANALYSIS_PARAMS_TMPL.format_map({
+            'aop_label': escape(report_data.aop_label),
+            'aop_id': escape(report_data.aop_id),
+            'logfc_threshold': report_data.logfc_threshold,
+            'pval_cutoff': report_data.pval_cutoff,
+            'id_column': escape(report_data.id_column),
+            'fc_column': escape(report_data.fc_column),
+            'pval_column': escape(report_data.pval_column),
+        })
     
-    def _generate_volcano_section(self, report_data: ReportData) -> str:
-        """Generate volcano plot section."""
-        if not report_data.volcano_data or not PLOTLY_AVAILABLE:
-            return """
-            <section class="volcano-section">
-                <h2>Volcano Plot</h2>
-                <p class="note">Volcano plot visualization not available.</p>
-            </section>
-            """
+    def _generate_volcano_section(self, report_data: ReportData, static: bool = False) -> str:
+        """Generate volcano plot section.
+        
+        Args:
+            report_data: Report data container
+            static: Embed a PNG image rather than the interactive Plotly plot
+        """
+        plot_available = (MATPLOTLIB_AVAILABLE or PLOTLY_AVAILABLE) if static else PLOTLY_AVAILABLE
+        if not report_data.volcano_data or not plot_available:
+            return _VOLCANO_UNAVAILABLE_HTML
         
         try:
-            # Create volcano plot using Plotly
-            volcano_html = self._create_volcano_plot(report_data.volcano_data, 
-                                                   report_data.logfc_threshold,
-                                                   report_data.pval_cutoff)
+            if static:
+                img_bytes = self._create_volcano_plot_image(report_data.volcano_data,
+                                                            report_data.logfc_threshold,
+                                                            report_data.pval_cutoff)
+                volcano_html = _VOLCANO_IMAGE_TMPL.format(data=base64.b64encode(img_bytes).decode('ascii'))
+            else:
+                # Create volcano plot using Plotly
+                volcano_html = self._create_volcano_plot(report_data.volcano_data, 
+                                                       report_data.logfc_threshold,
+                                                       report_data.pval_cutoff)
             
-            return f"""
-            <section class="volcano-section">
-                <h2>Volcano Plot</h2>
-                <div class="plot-description">
-                    <p>Volcano plot showing log2 fold change vs. -log10(p-value) for all genes. 
-                    Red points indicate significantly upregulated genes, blue points show significantly downregulated genes.</p>
-                </div>
-                <div class="plot-container">
-                    {volcano_html}
-                </div>
-            </section>
-            """
+            return _VOLCANO_SECTION_TMPL.format(plot=volcano_html)
             
         except Exception as e:
             logger.warning(f"Failed to generate volcano plot: {e}")
-            return """
-            <section class="volcano-section">
-                <h2>Volcano Plot</h2>
-                <p class="note">Error generating volcano plot visualization.</p>
-            </section>
-            """
+            return _VOLCANO_ERROR_HTML
     
     def _generate_enrichment_section(self, report_data: ReportData) -> str:
         """Generate Key Event enrichment results section."""
         if not report_data.enrichment_results:
-            return """
-            <section class="enrichment-section">
-                <h2>Key Event Enrichment Results</h2>
-                <p class="note">No enrichment results available.</p>
-            </section>
-            """
+            return _ENRICHMENT_UNAVAILABLE_HTML
         
-        # Create table rows
-        table_rows = ""
-        for result in report_data.enrichment_results[:20]:  # Show top 20 results
-            # Map actual field names from enrichment service
-            pval = result.get('p_value', 0)
-            adj_pval = result.get('FDR', pval)
-            ke_id = result.get('KE', 'N/A')
-            title = result.get('Title', 'N/A')
-            overlap_count = result.get('num_overlap', 0)
-            ke_size = result.get('total_KE_genes_in_dataset', 0)
-            odds_ratio = result.get('odds_ratio', 0)
-            
-            # Format odds ratio properly
-            odds_ratio_str = f"{odds_ratio:.2f}" if isinstance(odds_ratio, (int, float)) and odds_ratio != 'NA' else str(odds_ratio)
-            
-            table_rows += f"""
-            <tr class="{'significant' if adj_pval < 0.05 else ''}">
-                <td>{ke_id}</td>
-                <td>{title}</td>
-                <td>{overlap_count}</td>
-                <td>{ke_size}</td>
-                <td>{pval:.2e if pval < 0.001 else pval:.4f}</td>
-                <td>{adj_pval:.2e if adj_pval < 0.001 else adj_pval:.4f}</td>
-                <td>{odds_ratio_str}</td>
-            </tr>
-            """
+        sections = self._build_sections(report_data)
         
-        return f"""
-        <section class="enrichment-section">
-            <h2>Key Event Enrichment Results</h2>
-            <p class="section-description">
-                Statistical enrichment analysis of significantly differentially expressed genes 
-                against Key Event gene sets. Results are ranked by adjusted p-value.
-            </p>
-            
-            <div class="table-container">
-                <table class="enrichment-table">
-                    <thead>
-                        <tr>
-                            <th>KE ID</th>
-                            <th>Key Event Title</th>
-                            <th># Overlap</th>
-                            <th>KE Gene Count</th>
-                            <th>P-value</th>
-                            <th>FDR</th>
-                            <th>Odds Ratio</th>
-                        </tr>
-                    </thead>
-                    <tbody>
-                        {table_rows}
-                    </tbody>
-                </table>
-            </div>
-            
-            <div class="results-summary">
-                <p><strong>Total Key Events tested:</strong> {len(report_data.enrichment_results)}</p>
-                <p><strong>Significantly enriched (FDR < 0.05):</strong> 
-                   {len([r for r in report_data.enrichment_results if r.get('FDR', 1) < 0.05])}</p>
-            </div>
-        </section>
-        """
+        # Create table rows
+        table_rows = "".join([
+            _ENRICHMENT_ROW_TMPL.format_map({
+                **row,
+                'row_class': 'significant' if row['significant'] else '',
+                'ke_id': escape(row['ke_id']),
+                'title': escape(row['title']),
+            })
+            for row in sections['enrichment_rows']
+        ])
+        
+        return _ENRICHMENT_SECTION_TMPL.format_map({
+            'table_rows': table_rows,
+            'total': sections['enrichment_total'],
+            'significant': sections['enrichment_significant'],
+        })
     
     def _generate_system_info(self, report_data: ReportData) -> str:
         """Generate system information and software versions section."""
         versions = report_data.software_versions or {}
         
-        version_items = ""
-        for package, version in versions.items():
-            version_items += f"<li><strong>{package}:</strong> {version}</li>"
+        version_items = "".join([
+            _VERSION_ITEM_TMPL.format(package=escape(package), version=escape(version))
+            for package, version in versions.items()
+        ])
         
-        return f"""
-        <section class="system-info">
-            <h2>System Information</h2>
-            <div class="info-grid">
-                <div class="info-item">
-                    <label>Analysis Date:</label>
-                    <span>{report_data.analysis_timestamp.strftime('%Y-%m-%d %H:%M:%S UTC')}</span>
-                </div>
-                <div class="info-item">
-                    <label>Application:</label>
-                    <span>Molecular AOP Analyser</span>
-                </div>
-            </div>
+        return _SYSTEM_INFO_TMPL.format_map({
+            'timestamp': report_data._timestamp_str,
+            'versions': _VERSIONS_TMPL.format(version_items=version_items) if versions else '',
+        })
+    
+    def _prepare_volcano_arrays(self, volcano_data: List[Dict], threshold: float, pval_cutoff: float):
+        """Extract volcano plot coordinates, labels and point colors as NumPy arrays.
+        
+        Args:
+            volcano_data: List of dicts with 'ID', 'log2FC' and 'pval' keys
+            threshold: log2FC threshold for up/down regulation
+            pval_cutoff: P-value significance cutoff
             
-            {f'<div class="versions"><h3>Software Versions</h3><ul>{version_items}</ul></div>' if versions else ''}
-        </section>
+        Returns:
+            Tuple of (x_values, y_values, gene_names, color_codes) arrays, excluding
+            points whose p-value is missing or not positive or whose log2FC is not
+            finite. Color codes are int8
+            indices into _VOLCANO_PALETTE.
         """
+        df = pd.DataFrame(volcano_data, columns=['ID', 'log2FC', 'pval'])
+        fc = df['log2FC'].to_numpy(dtype=float)
+        pv = df['pval'].to_numpy(dtype=float)
+        # A fixed-width unicode array is serialized with a single tolist() by plotly.io,
+        # where an object array is cleaned label by label before reaching orjson
+        gene_names = df['ID'].fillna('').to_numpy(dtype=str)
+        
+        # Drop unplottable points once, so all arrays stay aligned
+        valid = (pv > 0) & np.isfinite(fc)
+        if not valid.all():
+            fc, pv, gene_names = fc[valid], pv[valid], gene_names[valid]
+        
+        y_values = -np.log10(pv)
+        
+        # Determine color codes based on significance, writing int8 codes in place;
+        # later assignments take precedence, so up beats down when threshold is 0
+        significant = pv < pval_cutoff
+        color_codes = np.full(len(pv), 3, dtype=np.int8)    # Not significant
+        color_codes[significant] = 2                        # Significant but low FC
+        color_codes[significant & (fc <= -threshold)] = 1   # Downregulated
+        color_codes[significant & (fc >= threshold)] = 0    # Upregulated
+        
+        return fc, y_values, gene_names, color_codes
+    
+    def _volcano_threshold_shapes(self, threshold: float, pval_cutoff: float,
+                                  line_width: Optional[float] = None) -> List[Dict[str, Any]]:
+        """Build layout shapes for the p-value cutoff and log2FC threshold lines."""
+        def line(dash):
+            style = {'dash': dash, 'color': 'black'}
+            if line_width is not None:
+                style['width'] = line_width
+            return style
+        
+        pval_y = -math.log10(pval_cutoff)
+        shapes = [{
+            'type': 'line', 'xref': 'x domain', 'x0': 0, 'x1': 1,
+            'yref': 'y', 'y0': pval_y, 'y1': pval_y, 'line': line('dash')
+        }]
+        if threshold > 0:
+            for x in (threshold, -threshold):
+                shapes.append({
+                    'type': 'line', 'xref': 'x', 'x0': x, 'x1': x,
+                    'yref': 'y domain', 'y0': 0, 'y1': 1, 'line': line('dot')
+                })
+        return shapes
     
     def _create_volcano_plot(self, volcano_data: List[Dict], threshold: float, pval_cutoff: float) -> str:
         """Create a volcano plot using Plotly and return as HTML string."""
@@ -462,302 +1027,174 @@ class ReportGenerator:
         
         try:
             # Extract data for plotting
-            x_values = [d['log2FC'] for d in volcano_data]
-            y_values = [-math.log10(d['pval']) for d in volcano_data if d['pval'] > 0]
-            gene_names = [d['ID'] for d in volcano_data]
-            
-            # Determine colors based on significance
-            colors = []
-            for d in volcano_data:
-                fc = d['log2FC']
-                pval = d['pval']
-                
-                if pval < pval_cutoff:
-                    if fc >= threshold:
-                        colors.append('red')  # Upregulated
-                    elif fc <= -threshold:
-                        colors.append('blue')  # Downregulated
-                    else:
-                        colors.append('green')  # Significant but low FC
-                else:
-                    colors.append('lightgray')  # Not significant
-            
-            # Create Plotly figure
-            fig = go.Figure(data=go.Scatter(
-                x=x_values,
-                y=y_values,
-                mode='markers',
-                marker=dict(color=colors, size=4),
-                text=gene_names,
-                hovertemplate='Gene: %{text}<br>log2FC: %{x}<br>-log10(p): %{y}<extra></extra>'
-            ))
+            x_values, y_values, gene_names, color_codes = self._prepare_volcano_arrays(
+                volcano_data, threshold, pval_cutoff
+            )
             
-            # Add threshold lines
-            fig.add_hline(y=-math.log10(pval_cutoff), line_dash="dash", line_color="black")
-            if threshold > 0:
-                fig.add_vline(x=threshold, line_dash="dot", line_color="black")
-                fig.add_vline(x=-threshold, line_dash="dot", line_color="black")
+            # Build the figure as a plain dict, skipping graph_objects validation; the
+            # WebGL trace draws the cloud in one call and numeric arrays travel as base64
+            fig = {
+                'data': [{
+                    'type': 'scattergl',
+                    'x': _typed_array(x_values),
+                    'y': _typed_array(y_values),
+                    'mode': 'markers',
+                    'marker': {'color': _typed_array(color_codes), 'size': 4, **_VOLCANO_MARKER_SCALE},
+                    'text': gene_names,
+                    'hovertemplate': 'Gene: %{text}<br>log2FC: %{x}<br>-log10(p): %{y}<extra></extra>'
+                }],
+                'layout': {
+                    'title': {'text': "Volcano Plot"},
+                    'xaxis': {'title': {'text': "log2 Fold Change"}},
+                    'yaxis': {'title': {'text': "-log10(p-value)"}},
+                    'width': 700,
+                    'height': 500,
+                    'showlegend': False,
+                    'shapes': self._volcano_threshold_shapes(threshold, pval_cutoff)
+                }
+            }
             
-            fig.update_layout(
-                title="Volcano Plot",
-                xaxis_title="log2 Fold Change",
-                yaxis_title="-log10(p-value)",
-                width=700,
-                height=500,
-                showlegend=False
+            # Only the figure JSON is embedded; the report's lazy-plot script draws it
+            # once the div scrolls into view, with plotly.js loaded once from the CDN
+            return _plotly_cdn_script() + _LAZY_PLOT_TMPL.format(
+                div_id='volcano-plot', figure=_plotly_io().to_json(fig, validate=False).replace('</', '<\\/')
             )
             
-            return fig.to_html(include_plotlyjs=False, div_id="volcano-plot")
-            
         except Exception as e:
             logger.warning(f"Failed to create volcano plot: {e}")
             return f"<p>Error creating volcano plot: {e}</p>"
     
-    def _create_volcano_plot_image(self, volcano_data: List[Dict], threshold: float, pval_cutoff: float) -> bytes:
-        """Create a volcano plot using Plotly and return as PNG image bytes for PDF inclusion."""
-        if not PLOTLY_AVAILABLE:
-            raise RuntimeError("Plotly not available for volcano plot generation")
+    def _create_volcano_plot_image(self, volcano_data: List[Dict], threshold: float, pval_cutoff: float,
+                                   width_px: int = 720, height_px: int = 475) -> bytes:
+        """Create a volcano plot and return as PNG image bytes for PDF inclusion.
+        
+        Renders in-process with Matplotlib's Agg backend when available, falling
+        back to Plotly's Kaleido export otherwise. The PNG is rendered at
+        ``width_px`` x ``height_px`` so it matches its size on the PDF page
+        instead of being downscaled by the viewer.
+        """
+        if not (MATPLOTLIB_AVAILABLE or PLOTLY_AVAILABLE):
+            raise RuntimeError("No plotting library available for volcano plot generation")
         
         try:
             # Extract data for plotting
-            x_values = [d['log2FC'] for d in volcano_data]
-            y_values = [-math.log10(d['pval']) for d in volcano_data if d['pval'] > 0]
-            gene_names = [d['ID'] for d in volcano_data]
-            
-            # Determine colors based on significance
-            colors = []
-            for d in volcano_data:
-                fc = d['log2FC']
-                pval = d['pval']
-                
-                if pval < pval_cutoff:
-                    if fc >= threshold:
-                        colors.append('red')  # Upregulated
-                    elif fc <= -threshold:
-                        colors.append('blue')  # Downregulated
-                    else:
-                        colors.append('green')  # Significant but low FC
-                else:
-                    colors.append('lightgray')  # Not significant
+            x_values, y_values, gene_names, color_codes = self._prepare_volcano_arrays(
+                volcano_data, threshold, pval_cutoff
+            )
             
-            # Create Plotly figure
-            fig = go.Figure(data=go.Scatter(
-                x=x_values,
-                y=y_values,
-                mode='markers',
-                marker=dict(color=colors, size=3),
-                text=gene_names,
-                hovertemplate='Gene: %{text}<br>log2FC: %{x}<br>-log10(p): %{y}<extra></extra>'
-            ))
+            if MATPLOTLIB_AVAILABLE:
+                return self._render_volcano_png(
+                    x_values, y_values, color_codes, threshold, pval_cutoff, width_px, height_px
+                )
             
-            # Add threshold lines
-            fig.add_hline(y=-math.log10(pval_cutoff), line_dash="dash", line_color="black", line_width=1)
-            if threshold > 0:
-                fig.add_vline(x=threshold, line_dash="dot", line_color="black", line_width=1)
-                fig.add_vline(x=-threshold, line_dash="dot", line_color="black", line_width=1)
+            grid = {'showgrid': True, 'gridwidth': 1, 'gridcolor': 'lightgray'}
             
-            fig.update_layout(
-                title="Volcano Plot - Gene Expression Analysis",
-                xaxis_title="log2 Fold Change",
-                yaxis_title="-log10(p-value)",
-                width=600,
-                height=400,
-                showlegend=False,
-                plot_bgcolor='white',
-                paper_bgcolor='white',
-                font=dict(size=10)
-            )
+            # Lay out at 600 CSS px wide and scale the export up to the requested pixels
+            layout_width = 600
+            layout_height = round(layout_width * height_px / width_px)
             
-            fig.update_xaxes(showgrid=True, gridwidth=1, gridcolor='lightgray')
-            fig.update_yaxes(showgrid=True, gridwidth=1, gridcolor='lightgray')
+            # Build the figure as a plain dict, skipping graph_objects validation
+            fig = {
+                'data': [{
+                    'type': 'scatter',
+                    'x': x_values,
+                    'y': y_values,
+                    'mode': 'markers',
+                    'marker': {'color': color_codes, 'size': 3, **_VOLCANO_MARKER_SCALE},
+                    'text': gene_names,
+                    'hovertemplate': 'Gene: %{text}<br>log2FC: %{x}<br>-log10(p): %{y}<extra></extra>'
+                }],
+                'layout': {
+                    'title': {'text': "Volcano Plot - Gene Expression Analysis"},
+                    'xaxis': {'title': {'text': "log2 Fold Change"}, **grid},
+                    'yaxis': {'title': {'text': "-log10(p-value)"}, **grid},
+                    'width': layout_width,
+                    'height': layout_height,
+                    'showlegend': False,
+                    'plot_bgcolor': 'white',
+                    'paper_bgcolor': 'white',
+                    'font': {'size': 10},
+                    'shapes': self._volcano_threshold_shapes(threshold, pval_cutoff, line_width=1)
+                }
+            }
             
             # Export as PNG image bytes
-            img_bytes = fig.to_image(format="png", width=600, height=400, scale=2)
+            img_bytes = _plotly_io().to_image(
+                fig, format="png", width=layout_width, height=layout_height,
+                scale=width_px / layout_width, validate=False
+            )
             return img_bytes
             
         except Exception as e:
             logger.warning(f"Failed to create volcano plot image: {e}")
             raise
     
+    def _render_volcano_png(self, x_values: np.ndarray, y_values: np.ndarray, color_codes: np.ndarray,
+                            threshold: float, pval_cutoff: float, width_px: int, height_px: int) -> bytes:
+        """Render volcano plot arrays to PNG bytes with Matplotlib's Agg canvas."""
+        dpi = self.PDF_IMAGE_DPI
+        fig = _matplotlib_figure()(figsize=(width_px / dpi, height_px / dpi), dpi=dpi)
+        ax = fig.add_subplot()
+        ax.scatter(x_values, y_values, c=_VOLCANO_PALETTE_ARRAY[color_codes], s=3, linewidths=0)
+        
+        ax.axhline(-math.log10(pval_cutoff), color='black', linestyle='--', linewidth=1)
+        if threshold > 0:
+            for x in (threshold, -threshold):
+                ax.axvline(x, color='black', linestyle=':', linewidth=1)
+        
+        ax.set_title("Volcano Plot - Gene Expression Analysis", fontsize=10)
+        ax.set_xlabel("log2 Fold Change", fontsize=10)
+        ax.set_ylabel("-log10(p-value)", fontsize=10)
+        ax.grid(True, color='lightgray', linewidth=0.5)
+        ax.set_axisbelow(True)
+        fig.tight_layout()
+        
+        buffer = BytesIO()
+        fig.savefig(buffer, format='png')
+        return buffer.getvalue()
+    
     def _get_report_css(self) -> str:
         """Get CSS styles for the report."""
-        return """
-        body {
-            font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
-            line-height: 1.6;
-            margin: 0;
-            padding: 0;
-            color: #29235C;
-            background-color: #f8f9fa;
-        }
-        
-        .container {
-            max-width: 1000px;
-            margin: 0 auto;
-            padding: 20px;
-        }
-        
-        .report-header {
-            background-color: #307BBF;
-            color: white;
-            padding: 30px;
-            text-align: center;
-            margin-bottom: 30px;
-        }
-        
-        .report-header h1 {
-            margin: 0 0 15px 0;
-            font-size: 28px;
-        }
-        
-        .report-meta p {
-            margin: 5px 0;
-            font-size: 14px;
-        }
-        
-        section {
-            background: white;
-            margin-bottom: 30px;
-            padding: 25px;
-            border-radius: 8px;
-            box-shadow: 0 2px 4px rgba(0,0,0,0.1);
-        }
-        
-        h2 {
-            color: #307BBF;
-            border-bottom: 2px solid #93D5F6;
-            padding-bottom: 10px;
-            margin-top: 0;
-        }
-        
-        h3 {
-            color: #29235C;
-            margin-top: 20px;
-        }
-        
-        .metadata-grid, .params-grid, .info-grid {
-            display: grid;
-            grid-template-columns: repeat(auto-fit, minmax(250px, 1fr));
-            gap: 15px;
-            margin-top: 15px;
-        }
-        
-        .metadata-item, .param-item, .info-item, .stat-item {
-            display: flex;
-            flex-direction: column;
-        }
-        
-        .metadata-item.full-width {
-            grid-column: 1 / -1;
-        }
-        
-        .metadata-item label, .param-item label, .info-item label, .stat-item label {
-            font-weight: bold;
-            color: #29235C;
-            margin-bottom: 5px;
-        }
-        
-        .summary-stats {
-            display: grid;
-            grid-template-columns: repeat(auto-fit, minmax(200px, 1fr));
-            gap: 15px;
-            margin-top: 15px;
-        }
-        
-        .table-container {
-            overflow-x: auto;
-            margin-top: 15px;
-        }
-        
-        .enrichment-table {
-            width: 100%;
-            border-collapse: collapse;
-            margin-top: 15px;
-        }
-        
-        .enrichment-table th, .enrichment-table td {
-            border: 1px solid #ddd;
-            padding: 8px;
-            text-align: left;
-        }
-        
-        .enrichment-table th {
-            background-color: #307BBF;
-            color: white;
-            font-weight: bold;
-        }
-        
-        .enrichment-table tr.significant {
-            background-color: #fff3cd;
-        }
-        
-        .enrichment-table tr:nth-child(even):not(.significant) {
-            background-color: #f8f9fa;
-        }
-        
-        .plot-container {
-            margin-top: 15px;
-            text-align: center;
-        }
-        
-        .plot-description {
-            font-style: italic;
-            color: #666;
-            margin-bottom: 15px;
-        }
-        
-        .section-description {
-            color: #666;
-            font-style: italic;
-            margin-bottom: 15px;
-        }
-        
-        .results-summary {
-            margin-top: 20px;
-            padding: 15px;
-            background-color: #f8f9fa;
-            border-radius: 5px;
-            border-left: 4px solid #307BBF;
-        }
-        
-        .note {
-            color: #666;
-            font-style: italic;
-        }
-        
-        .versions ul {
-            list-style-type: none;
-            padding-left: 0;
-        }
-        
-        .versions li {
-            margin-bottom: 5px;
-        }
-        
-        @media print {
-            body { background-color: white; }
-            section { box-shadow: none; border: 1px solid #ddd; }
-            .report-header { background-color: #307BBF !important; }
-        }
-        """
+        return _REPORT_CSS
     
-    def _generate_reportlab_pdf(self, report_data: ReportData) -> bytes:
+    def _generate_reportlab_pdf(self, report_data: ReportData, out: Optional[BinaryIO] = None) -> Optional[bytes]:
         """Generate a PDF report using ReportLab (pure Python, no system dependencies).
         
         Args:
             report_data: Complete report data container
+            out: Optional writable binary stream to write the PDF to
             
         Returns:
-            PDF content as bytes
+            PDF content as bytes, or None when written to ``out``
         """
         if not REPORTLAB_AVAILABLE:
             raise RuntimeError("ReportLab not available")
-            
-        buffer = BytesIO()
         
+        if out is None:
+            # getvalue() hands back BytesIO's own buffer without copying it, and
+            # the with block releases the buffer even if the build raises
+            with BytesIO() as buffer:
+                self._generate_reportlab_pdf(report_data, buffer)
+                pdf_bytes = buffer.getvalue()
+            logger.info("ReportLab PDF generated successfully (%d bytes)", len(pdf_bytes))
+            return pdf_bytes
+        
+        # Start rendering the volcano image now; it is collected where the flowable is added
+        volcano_future = None
+        if report_data.volcano_data and (MATPLOTLIB_AVAILABLE or PLOTLY_AVAILABLE):
+            volcano_width_in, volcano_height_in = self.PDF_VOLCANO_SIZE_IN
+            volcano_future = _IMAGE_EXECUTOR.submit(
+                self._create_volcano_plot_image,
+                report_data.volcano_data,
+                report_data.logfc_threshold,
+                report_data.pval_cutoff,
+                round(volcano_width_in * self.PDF_IMAGE_DPI),
+                round(volcano_height_in * self.PDF_IMAGE_DPI)
+            )
+            
         # Create document with custom page size and margins
         doc = SimpleDocTemplate(
-            buffer,
+            out,
             pagesize=A4,
             rightMargin=72,
             leftMargin=72,
@@ -765,244 +1202,191 @@ class ReportGenerator:
             bottomMargin=18
         )
         
-        # Get style sheet and define custom styles
-        styles = getSampleStyleSheet()
-        
-        # Define house style colors
-        primary_color = HexColor('#307BBF')
-        dark_color = HexColor('#29235C')
-        accent_color = HexColor('#E6007E')
-        
-        # Custom styles
-        title_style = ParagraphStyle(
-            'CustomTitle',
-            parent=styles['Heading1'],
-            fontSize=24,
-            spaceAfter=30,
-            textColor=dark_color,
-            alignment=1  # Center
-        )
-        
-        heading_style = ParagraphStyle(
-            'CustomHeading',
-            parent=styles['Heading2'],
-            fontSize=16,
-            spaceAfter=12,
-            textColor=primary_color,
-            borderWidth=1,
-            borderColor=primary_color,
-            borderPadding=5
-        )
-        
-        normal_style = ParagraphStyle(
-            'CustomNormal',
-            parent=styles['Normal'],
-            fontSize=10,
-            textColor=dark_color
-        )
+        sections = self._build_sections(report_data)
         
         # Build document content
         story = []
+        image_buffers: List[BytesIO] = []
         
         # Header section
-        story.append(Paragraph("Molecular AOP Analysis Report", title_style))
-        story.append(Spacer(1, 12))
+        story.extend([
+            _paragraph("Molecular AOP Analysis Report", _PDF_TITLE_STYLE),
+            Spacer(1, 12),
+        ])
         
         # Report metadata
         metadata_text = f"""
-        <b>Dataset:</b> {report_data.metadata.get('dataset_id', 'N/A')}<br/>
-        <b>Generated:</b> {report_data.analysis_timestamp.strftime('%Y-%m-%d %H:%M:%S')}<br/>
+        <b>Dataset:</b> {sections['dataset_id']}<br/>
+        <b>Generated:</b> {sections['generated']}<br/>
         <b>AOP:</b> {report_data.aop_label}
         """
-        story.append(Paragraph(metadata_text, normal_style))
-        story.append(Spacer(1, 20))
+        story.extend([
+            Paragraph(metadata_text, _PDF_NORMAL_STYLE),
+            Spacer(1, 20),
+        ])
         
         # Input Data Summary
-        story.append(Paragraph("Input Data Summary", heading_style))
+        story.append(_paragraph("Input Data Summary", _PDF_HEADING_STYLE))
         
         summary_data = [
             ['Metric', 'Value'],
-            ['Filename', report_data.filename],
-            ['Total Genes', f"{report_data.gene_count:,}"],
-            ['Significant Genes', f"{report_data.significant_genes:,}"],
-            ['Gene ID Type', report_data.id_type],
+            *(list(row) for row in sections['input_summary']),
             ['Log2FC Threshold', str(report_data.logfc_threshold)],
             ['P-value Cutoff', str(report_data.pval_cutoff)]
         ]
         
-        summary_table = Table(summary_data, colWidths=[2.5*inch, 3.5*inch])
-        summary_table.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (-1, 0), primary_color),
-            ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-            ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-            ('FONTSIZE', (0, 0), (-1, 0), 12),
-            ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-            ('BACKGROUND', (0, 1), (-1, -1), colors.beige),
-            ('GRID', (0, 0), (-1, -1), 1, colors.black)
-        ]))
+        summary_table = Table(
+            summary_data,
+            colWidths=[2.5*inch, 3.5*inch],
+            rowHeights=[_PDF_ROW_HEIGHT + 9] + [_PDF_ROW_HEIGHT] * (len(summary_data) - 1)  # header has 12pt bottom padding
+        )
+        summary_table.setStyle(_PDF_SUMMARY_TABLE_STYLE)
         
-        story.append(summary_table)
-        story.append(Spacer(1, 20))
+        story.extend([
+            summary_table,
+            Spacer(1, 20),
+        ])
         
         # Key Event Enrichment Results
-        logger.info(f"ReportLab: enrichment_results present: {bool(report_data.enrichment_results)}")
+        logger.info("ReportLab: enrichment_results present: %s", bool(report_data.enrichment_results))
         if report_data.enrichment_results:
-            logger.info(f"ReportLab: Processing {len(report_data.enrichment_results)} enrichment results")
-            story.append(Paragraph("Key Event Enrichment Results", heading_style))
-            story.append(Paragraph("Statistical enrichment analysis results ranked by FDR", normal_style))
-            story.append(Spacer(1, 12))
+            logger.info("ReportLab: Processing %d enrichment results", len(report_data.enrichment_results))
+            story.extend([
+                _paragraph("Key Event Enrichment Results", _PDF_HEADING_STYLE),
+                _paragraph("Statistical enrichment analysis results ranked by FDR", _PDF_NORMAL_STYLE),
+                Spacer(1, 12),
+            ])
             
             # Prepare table data (show top 15 results for space)
             table_data = [['KE ID', 'Key Event Title', '# Overlap', 'P-value', 'FDR', 'Odds Ratio']]
             
-            for result in report_data.enrichment_results[:15]:
-                pval = result.get('p_value', 0)
-                fdr = result.get('FDR', pval)
-                odds_ratio = result.get('odds_ratio', 0)
-                
-                # Format values
-                pval_str = f"{pval:.2e}" if pval < 0.001 else f"{pval:.4f}"
-                fdr_str = f"{fdr:.2e}" if fdr < 0.001 else f"{fdr:.4f}"
-                odds_str = f"{odds_ratio:.2f}" if isinstance(odds_ratio, (int, float)) and odds_ratio != 'NA' else str(odds_ratio)
-                
-                title = result.get('Title', 'N/A')
+            # Only the significant-row highlights vary per report
+            highlights = []
+            
+            # Build rows and highlight significant results in a single pass
+            pdf_rows = sections['enrichment_rows'][:self.PDF_ENRICHMENT_TABLE_ROWS]
+            append_row = table_data.append
+            for i, row in enumerate(pdf_rows, 1):
+                title = row['title']
                 if len(title) > 40:
                     title = title[:37] + "..."
                 
-                table_data.append([
-                    result.get('KE', 'N/A'),
+                append_row([
+                    row['ke_id'],
                     title,
-                    str(result.get('num_overlap', 0)),
-                    pval_str,
-                    fdr_str,
-                    odds_str
+                    str(row['overlap']),
+                    row['p_value'],
+                    row['fdr'],
+                    row['odds_ratio']
                 ])
+                if row['fdr_significant']:
+                    highlights.append(('BACKGROUND', (0, i), (-1, i), _PDF_HIGHLIGHT_COLOR))
             
             # Create table with appropriate column widths
             col_widths = [0.8*inch, 2.2*inch, 0.8*inch, 0.8*inch, 0.8*inch, 0.8*inch]
-            enrichment_table = Table(table_data, colWidths=col_widths)
-            
-            # Style the table
-            table_style = [
-                ('BACKGROUND', (0, 0), (-1, 0), primary_color),
-                ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-                ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-                ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-                ('FONTSIZE', (0, 0), (-1, 0), 9),
-                ('FONTSIZE', (0, 1), (-1, -1), 8),
-                ('BOTTOMPADDING', (0, 0), (-1, 0), 8),
-                ('GRID', (0, 0), (-1, -1), 1, colors.black),
-                ('VALIGN', (0, 0), (-1, -1), 'TOP'),
-            ]
-            
-            # Highlight significant results
-            for i, result in enumerate(report_data.enrichment_results[:15], 1):
-                if result.get('FDR', 1) < 0.05:
-                    table_style.append(('BACKGROUND', (0, i), (-1, i), colors.lightyellow))
-            
-            enrichment_table.setStyle(TableStyle(table_style))
-            story.append(enrichment_table)
+            enrichment_table = Table(
+                table_data,
+                colWidths=col_widths,
+                rowHeights=[_PDF_ROW_HEIGHT + 5] + [_PDF_ROW_HEIGHT] * (len(table_data) - 1)  # header has 8pt bottom padding
+            )
+            enrichment_table.setStyle(_PDF_ENRICHMENT_TABLE_STYLE)
+            if highlights:
+                enrichment_table.setStyle(highlights)
             
             # Summary statistics
-            story.append(Spacer(1, 12))
-            sig_count = len([r for r in report_data.enrichment_results if r.get('FDR', 1) < 0.05])
             summary_text = f"""
-            <b>Total Key Events tested:</b> {len(report_data.enrichment_results)}<br/>
-            <b>Significantly enriched (FDR &lt; 0.05):</b> {sig_count}<br/>
-            <i>Note: Only top 15 results shown in table above</i>
+            <b>Total Key Events tested:</b> {sections['enrichment_total']}<br/>
+            <b>Significantly enriched (FDR &lt; 0.05):</b> {sections['enrichment_significant']}<br/>
+            <i>Note: Only top {self.PDF_ENRICHMENT_TABLE_ROWS} results shown in table above</i>
             """
-            story.append(Paragraph(summary_text, normal_style))
+            story.extend([
+                enrichment_table,
+                Spacer(1, 12),
+                Paragraph(summary_text, _PDF_NORMAL_STYLE),
+            ])
         
         # Volcano Plot Section
-        logger.info(f"ReportLab: volcano_data present: {bool(report_data.volcano_data)}")
+        logger.info("ReportLab: volcano_data present: %s", bool(report_data.volcano_data))
         if report_data.volcano_data:
-            logger.info(f"ReportLab: volcano_data length: {len(report_data.volcano_data)}")
-        if report_data.volcano_data and PLOTLY_AVAILABLE:
+            logger.info("ReportLab: volcano_data length: %d", len(report_data.volcano_data))
+        if volcano_future is not None:
             try:
-                story.append(Spacer(1, 30))
-                story.append(Paragraph("Volcano Plot", heading_style))
-                story.append(Paragraph("Gene expression analysis showing log2 fold change vs. statistical significance", normal_style))
-                story.append(Spacer(1, 12))
+                story.extend([
+                    Spacer(1, 30),
+                    _paragraph("Volcano Plot", _PDF_HEADING_STYLE),
+                    _paragraph("Gene expression analysis showing log2 fold change vs. statistical significance", _PDF_NORMAL_STYLE),
+                    Spacer(1, 12),
+                ])
                 
-                # Generate volcano plot image
-                img_bytes = self._create_volcano_plot_image(
-                    report_data.volcano_data,
-                    report_data.logfc_threshold,
-                    report_data.pval_cutoff
-                )
+                # Wait for the volcano plot image started above
+                img_bytes = volcano_future.result()
                 
-                # Create image from bytes
-                img_buffer = BytesIO(img_bytes)
-                img = Image(img_buffer, width=5*inch, height=3.3*inch)
-                story.append(img)
+                _add_image(story, image_buffers, img_bytes, volcano_width_in*inch, volcano_height_in*inch)
                 
                 # Add legend
-                story.append(Spacer(1, 12))
-                legend_text = """
-                <b>Legend:</b><br/>
-                • <font color="red">Red points</font>: Significantly upregulated genes (p &lt; {pval}, log2FC ≥ {fc})<br/>
-                • <font color="blue">Blue points</font>: Significantly downregulated genes (p &lt; {pval}, log2FC ≤ -{fc})<br/>
-                • <font color="green">Green points</font>: Significant but low fold change<br/>
-                • <font color="gray">Gray points</font>: Non-significant genes<br/>
-                • Horizontal dashed line: p-value cutoff ({pval})<br/>
-                • Vertical dotted lines: log2FC thresholds (±{fc})
-                """.format(pval=report_data.pval_cutoff, fc=report_data.logfc_threshold)
-                story.append(Paragraph(legend_text, normal_style))
+                thresholds = {'pval': report_data.pval_cutoff, 'fc': report_data.logfc_threshold}
+                story.extend([
+                    Spacer(1, 12),
+                    _legend_table("Legend:", tuple(item % thresholds for item in _PDF_VOLCANO_LEGEND_ITEMS)),
+                ])
                 
                 logger.info("Added volcano plot to PDF report")
                 
             except Exception as e:
-                logger.warning(f"Failed to add volcano plot to PDF: {e}")
-                story.append(Spacer(1, 30))
-                story.append(Paragraph("Volcano Plot", heading_style))
-                story.append(Paragraph("Error generating volcano plot visualization.", normal_style))
+                logger.warning("Failed to add volcano plot to PDF: %s", e)
+                story.extend([
+                    Spacer(1, 30),
+                    _paragraph("Volcano Plot", _PDF_HEADING_STYLE),
+                    _paragraph("Error generating volcano plot visualization.", _PDF_NORMAL_STYLE),
+                ])
         
-        elif report_data.volcano_data and not PLOTLY_AVAILABLE:
-            story.append(Spacer(1, 30))
-            story.append(Paragraph("Volcano Plot", heading_style))
-            story.append(Paragraph("Volcano plot not available - Plotly not installed.", normal_style))
+        elif report_data.volcano_data:
+            story.extend([
+                Spacer(1, 30),
+                _paragraph("Volcano Plot", _PDF_HEADING_STYLE),
+                _paragraph("Volcano plot not available - Matplotlib or Plotly is required.", _PDF_NORMAL_STYLE),
+            ])
         
         # Network Visualization Section
-        logger.info(f"ReportLab: network_png present: {bool(report_data.network_png)}")
+        logger.info("ReportLab: network_png present: %s", bool(report_data.network_png))
         if report_data.network_png:
-            logger.info(f"ReportLab: network_png length: {len(report_data.network_png)}")
-            logger.info(f"ReportLab: network_png starts with: {report_data.network_png[:50]}...")
+            logger.info("ReportLab: network_png length: %d", len(report_data.network_png))
+            logger.info("ReportLab: network_png starts with: %s...", report_data.network_png[:50])
             
             try:
-                story.append(Spacer(1, 30))
-                story.append(Paragraph("AOP Network Visualization", heading_style))
-                story.append(Paragraph("Adverse Outcome Pathway showing Key Events and their relationships", normal_style))
-                story.append(Spacer(1, 12))
+                story.extend([
+                    Spacer(1, 30),
+                    _paragraph("AOP Network Visualization", _PDF_HEADING_STYLE),
+                    _paragraph("Adverse Outcome Pathway showing Key Events and their relationships", _PDF_NORMAL_STYLE),
+                    Spacer(1, 12),
+                ])
                 
                 # Handle network image data
                 network_data = report_data.network_png
                 
-                if network_data.startswith('<svg') and SVG_SUPPORT:
-                    # Handle SVG data directly
-                    from io import StringIO
-                    svg_buffer = StringIO(network_data)
-                    drawing = renderSVG(svg_buffer)
+                if network_data.lstrip().startswith(('<svg', '<?xml')) and SVG_SUPPORT:
+                    # Convert SVG to native ReportLab vector drawing operations;
+                    # bytes input lets lxml honour the XML encoding declaration
+                    from svglib.svglib import svg2rlg
+                    drawing = svg2rlg(BytesIO(network_data.encode('utf-8')))
                     if drawing:
-                        drawing.width = 6*inch
-                        drawing.height = 4*inch
+                        # Scale to the same 7 inch width as PNG input, preserving aspect ratio
+                        scale = 7*inch / drawing.width
+                        drawing.scale(scale, scale)
+                        drawing.width *= scale
+                        drawing.height *= scale
                         story.append(drawing)
                     logger.info("Added SVG network visualization to PDF")
                 else:
                     # Handle base64 encoded image data (PNG/JPEG)
-                    import base64
-                    # Remove data URL prefix if present
-                    if network_data.startswith('data:image/'):
-                        network_data = network_data.split(',')[1]
+                    # Remove data URL prefix if present, slicing rather than splitting the payload
+                    start = network_data.find(',') + 1 if network_data.startswith('data:image/') else 0
                     
-                    # Create image from base64 data
-                    img_bytes = base64.b64decode(network_data)
-                    img_buffer = BytesIO(img_bytes)
+                    # Create image from base64 data; a memoryview slice avoids copying the payload again
+                    img_bytes = base64.b64decode(memoryview(network_data.encode('ascii'))[start:])
                     
                     # Get original image dimensions to preserve aspect ratio
-                    from PIL import Image as PILImage
-                    pil_img = PILImage.open(BytesIO(img_bytes))
-                    original_width, original_height = pil_img.size
+                    original_width, original_height = _image_size(img_bytes)
                     
                     # Calculate dimensions preserving aspect ratio, max width 7 inches
                     max_width = 7*inch
@@ -1010,39 +1394,43 @@ class ReportGenerator:
                     img_width = min(max_width, 7*inch)
                     img_height = img_width * aspect_ratio
                     
-                    img_buffer.seek(0)  # Reset buffer position
-                    img = Image(img_buffer, width=img_width, height=img_height)
-                    story.append(img)
-                    logger.info(f"Added PNG network visualization to PDF ({original_width}x{original_height} -> {img_width:.0f}x{img_height:.0f})")
+                    _add_image(story, image_buffers, img_bytes, img_width, img_height)
+                    logger.info(
+                        "Added PNG network visualization to PDF (%dx%d -> %.0fx%.0f)",
+                        original_width, original_height, img_width, img_height
+                    )
                 
                 # Add network legend
-                story.append(Spacer(1, 12))
-                legend_text = """
-                <b>Network Legend:</b><br/>
-                • <font color="#b3e6b3">Green circles</font>: Molecular Initiating Events (MIEs)<br/>
-                • <font color="#ffd9b3">Orange circles</font>: Intermediate Key Events<br/>
-                • <font color="#f4b3b3">Pink circles</font>: Adverse Outcomes (AOs)<br/>
-                • <font color="red">Red border</font>: Significantly enriched Key Events (FDR &lt; 0.05)<br/>
-                • Arrows indicate causal relationships between Key Events
-                """
-                story.append(Paragraph(legend_text, normal_style))
+                story.extend([
+                    Spacer(1, 12),
+                    _legend_table("Network Legend:", _PDF_NETWORK_LEGEND_ITEMS),
+                ])
                 
                 # Add Network Statistics
-                story.append(Spacer(1, 20))
-                story.append(Paragraph("📊 Network Statistics", heading_style))
+                story.extend([
+                    Spacer(1, 20),
+                    _paragraph("📊 Network Statistics", _PDF_HEADING_STYLE),
+                ])
                 
                 # Extract statistics from network data if available
                 if report_data.network_data and 'nodes' in report_data.network_data:
                     nodes = report_data.network_data['nodes']
                     edges = report_data.network_data['edges']
                     
-                    # Count different node types
-                    total_kes = len([n for n in nodes if not n.get('classes', '').startswith('gene')])
-                    total_genes = len([n for n in nodes if n.get('classes', '').startswith('gene')])
-                    sig_kes = len([n for n in nodes if 'significant' in n.get('classes', '') and not n.get('classes', '').startswith('gene')])
-                    sig_genes = len([n for n in nodes if 'significant' in n.get('classes', '') and n.get('classes', '').startswith('gene')])
-                    ke_edges = len([e for e in edges if not e.get('classes', '').startswith('gene-link')])
-                    gene_edges = len([e for e in edges if e.get('classes', '').startswith('gene-link')])
+                    # Count different node types in a single pass
+                    total_kes = sig_kes = total_genes = sig_genes = 0
+                    for n in nodes:
+                        node_classes = n.get('classes', '')
+                        is_sig = 'significant' in node_classes
+                        if node_classes.startswith('gene'):
+                            total_genes += 1
+                            sig_genes += is_sig
+                        else:
+                            total_kes += 1
+                            sig_kes += is_sig
+                    
+                    gene_edges = sum(1 for e in edges if e.get('classes', '').startswith('gene-link'))
+                    ke_edges = len(edges) - gene_edges
                     
                     # Create statistics table
                     stats_data = [
@@ -1056,25 +1444,12 @@ class ReportGenerator:
                         ['Total Network Edges', str(len(edges))]
                     ]
                     
-                    stats_table = Table(stats_data, colWidths=[3*inch, 1.5*inch])
-                    stats_table.setStyle(TableStyle([
-                        # Header styling
-                        ('BACKGROUND', (0, 0), (-1, 0), HexColor('#307BBF')),
-                        ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
-                        ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-                        ('ALIGN', (1, 0), (1, -1), 'RIGHT'),  # Right-align values
-                        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-                        ('FONTSIZE', (0, 0), (-1, 0), 12),
-                        
-                        # Data styling
-                        ('FONTNAME', (0, 1), (-1, -1), 'Helvetica'),
-                        ('FONTSIZE', (0, 1), (-1, -1), 10),
-                        ('GRID', (0, 0), (-1, -1), 1, colors.black),
-                        ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-                        
-                        # Alternating row colors
-                        ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, HexColor('#f9f9f9')])
-                    ]))
+                    stats_table = Table(
+                        stats_data,
+                        colWidths=[3*inch, 1.5*inch],
+                        rowHeights=[_PDF_ROW_HEIGHT] * len(stats_data)
+                    )
+                    stats_table.setStyle(_PDF_STATS_TABLE_STYLE)
                     
                     story.append(stats_table)
                     logger.info("Added network statistics to PDF report")
@@ -1082,46 +1457,77 @@ class ReportGenerator:
                 logger.info("Added network visualization to PDF report")
                 
             except Exception as e:
-                logger.warning(f"Failed to add network visualization to PDF: {e}")
-                story.append(Spacer(1, 30))
-                story.append(Paragraph("AOP Network Visualization", heading_style))
-                story.append(Paragraph("Error generating network visualization.", normal_style))
+                logger.warning("Failed to add network visualization to PDF: %s", e)
+                story.extend([
+                    Spacer(1, 30),
+                    _paragraph("AOP Network Visualization", _PDF_HEADING_STYLE),
+                    _paragraph("Error generating network visualization.", _PDF_NORMAL_STYLE),
+                ])
         
         # System Information
-        story.append(Spacer(1, 30))
-        story.append(Paragraph("System Information", heading_style))
-        
-        sys_info = f"""
-        <b>Analysis Date:</b> {report_data.analysis_timestamp.strftime('%Y-%m-%d %H:%M:%S')}<br/>
-        <b>Application:</b> Molecular AOP Analyser<br/>
-        <b>Report Format:</b> PDF (ReportLab)
-        """
+        story.extend([
+            Spacer(1, 30),
+            _paragraph("System Information", _PDF_HEADING_STYLE),
+        ])
+        
+        sys_info = [
+            ['Analysis Date:', report_data._timestamp_str],
+            ['Application:', 'Molecular AOP Analyser'],
+            ['Report Format:', 'PDF (ReportLab)'],
+        ]
+        label_rows = len(sys_info)
         
         if report_data.software_versions:
-            sys_info += "<br/><b>Software Versions:</b><br/>"
-            for package, version in report_data.software_versions.items():
-                sys_info += f"• {package}: {version}<br/>"
-        
-        story.append(Paragraph(sys_info, normal_style))
+            sys_info.append(['Software Versions:', ''])
+            label_rows += 1
+            sys_info += [
+                [f'• {package}:', version]
+                for package, version in report_data.software_versions.items()
+            ]
         
-        # Build PDF
-        doc.build(story)
+        sys_info_table = Table(
+            sys_info,
+            colWidths=[1.5*inch, _PDF_FRAME_WIDTH - 1.5*inch],
+            rowHeights=[_PDF_LIST_ROW_HEIGHT] * len(sys_info)
+        )
+        sys_info_table.setStyle(_PDF_LIST_STYLE)
+        sys_info_table.setStyle(TableStyle([
+            ('FONTNAME', (0, 0), (0, label_rows - 1), 'Helvetica-Bold'),
+        ]))
+        story.append(sys_info_table)
         
-        # Get PDF content
-        buffer.seek(0)
-        pdf_bytes = buffer.getvalue()
-        buffer.close()
+        # Build PDF, then release the image buffers it read from
+        try:
+            doc.build(story)
+        finally:
+            for image_buffer in image_buffers:
+                image_buffer.close()
         
-        logger.info(f"ReportLab PDF generated successfully ({len(pdf_bytes)} bytes)")
-        return pdf_bytes
+        logger.info("ReportLab PDF written to output stream")
+        return None
 
 
 # Global report generator instance
 report_generator = ReportGenerator()
 
 
+def _render_pdf_worker(report_data: ReportData) -> bytes:
+    """Render one PDF in a batch worker process (module-level so it can be pickled)."""
+    return report_generator.generate_pdf_report(report_data)
+
+
+def _render_html_worker(report_data: ReportData) -> str:
+    """Render one HTML report in a batch worker process."""
+    return report_generator.generate_html_report(report_data)
+
+
+@lru_cache(maxsize=1)
 def get_software_versions() -> Dict[str, str]:
-    """Get versions of key software packages."""
+    """Get versions of key software packages.
+    
+    Versions cannot change within a process, so the dict is built once and the
+    same instance is returned on every call; callers must not mutate it.
+    """
     versions = {}
     
     try:
@@ -1149,10 +1555,10 @@ def get_software_versions() -> Dict[str, str]:
         pass
     
     if PLOTLY_AVAILABLE:
+        # Read the installed version without importing plotly
         try:
-            import plotly
-            versions['Plotly'] = plotly.__version__
-        except AttributeError:
+            versions['Plotly'] = metadata.version('plotly')
+        except metadata.PackageNotFoundError:
             pass
     
     return versions
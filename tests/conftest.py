@@ -11,18 +11,49 @@ import pytest
 import pandas as pd
 from datetime import datetime
 from unittest.mock import Mock, patch
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import scoped_session, sessionmaker
+from sqlalchemy.pool import StaticPool
 
 # Add parent directory to path for imports
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 # Import application components
-from app import app as flask_app
-from database import DatabaseManager, ExperimentRecord, Base
+from app import app as flask_app, _read_dataset
+from database import DatabaseManager, ExperimentRecord, Base, SESSION_OPTIONS
 from config import Config, ExperimentMetadata
 from services.report_service import ReportData
 from services.column_detector import ColumnDetector
 from services.gene_id_validator import GeneIDValidator
 
+def pytest_addoption(parser):
+    """Register the command line switch that opts into slow tests."""
+    parser.addoption('--runslow', action='store_true', default=False,
+                     help='run tests marked as slow')
+
+
+def pytest_collection_modifyitems(config, items):
+    """Skip tests marked as slow unless --runslow is given."""
+    if config.getoption('--runslow'):
+        return
+    
+    skip_slow = pytest.mark.skip(reason='slow test, use --runslow to run')
+    for item in items:
+        if 'slow' in item.keywords:
+            item.add_marker(skip_slow)
+
+
+def pytest_configure(config):
+    """Configure the shared Flask app once per test process."""
+    flask_app.config.update({
+        'TESTING': True,
+        'WTF_CSRF_ENABLED': False,  # Disable CSRF for tests
+        'SECRET_KEY': 'test-secret-key',
+        'TEMPLATES_AUTO_RELOAD': False,  # Don't stat template files on every render
+        'PROPAGATE_EXCEPTIONS': True,
+    })
+    flask_app.jinja_env.auto_reload = False
+
 
 @pytest.fixture(scope='session')
 def test_data_dir():
@@ -41,9 +72,9 @@ def sample_gene_data():
     })
 
 
-@pytest.fixture
+@pytest.fixture(scope='session')
 def sample_metadata():
-    """Fixture providing sample experiment metadata."""
+    """Fixture providing sample experiment metadata (shared; do not modify)."""
     return ExperimentMetadata(
         dataset_id="TEST001",
         stressor="Test Chemical",
@@ -83,48 +114,98 @@ def sample_report_data(sample_metadata):
     )
 
 
+@pytest.fixture(scope='session')
+def database_engine():
+    """Fixture providing one in-memory SQLite engine with the schema, shared per session."""
+    # StaticPool keeps the single in-memory connection alive for every session
+    engine = create_engine(
+        "sqlite:///:memory:",
+        connect_args={'check_same_thread': False},
+        poolclass=StaticPool
+    )
+    
+    # Let SQLAlchemy issue BEGIN itself so SAVEPOINTs nest inside the test transaction
+    @event.listens_for(engine, 'connect')
+    def _disable_pysqlite_transactions(dbapi_connection, connection_record):
+        dbapi_connection.isolation_level = None
+    
+    @event.listens_for(engine, 'begin')
+    def _begin(connection):
+        connection.exec_driver_sql('BEGIN')
+    
+    Base.metadata.create_all(bind=engine)
+    yield engine
+    engine.dispose()
+
+
 @pytest.fixture
-def temp_database():
-    """Fixture providing a temporary test database."""
-    with tempfile.NamedTemporaryFile(suffix='.db', delete=False) as f:
-        db_path = f.name
+def temp_database(database_engine):
+    """Fixture providing a database manager whose writes are rolled back after the test."""
+    connection = database_engine.connect()
+    transaction = connection.begin()
     
-    # Create test database manager
-    db_manager = DatabaseManager(db_url=f"sqlite:///{db_path}")
-    db_manager.initialize()
+    # Same session registry as production, but sessions commit to SAVEPOINTs
+    # inside the outer transaction
+    db_manager = DatabaseManager(db_url=str(database_engine.url))
+    db_manager.engine = database_engine
+    db_manager.SessionLocal = scoped_session(sessionmaker(
+        bind=connection,
+        join_transaction_mode='create_savepoint',
+        **SESSION_OPTIONS
+    ))
     
     yield db_manager
     
-    # Cleanup
-    try:
-        os.unlink(db_path)
-    except OSError:
-        pass
+    db_manager.SessionLocal.remove()
+    transaction.rollback()
+    connection.close()
+
+
+@pytest.fixture
+def seed_experiments(temp_database, sample_metadata):
+    """Fixture returning a callable that inserts experiment rows in a single transaction.
+    
+    Each dictionary passed to the callable overrides fields of ``sample_metadata``;
+    the callable returns the new record IDs in input order.
+    """
+    base_metadata = sample_metadata.to_dict()
+    
+    def seed(overrides):
+        return temp_database.save_experiment_metadata_bulk(
+            [{**base_metadata, **fields} for fields in overrides]
+        )
+    
+    return seed
 
 
 @pytest.fixture
 def flask_client():
-    """Fixture providing Flask test client."""
-    # Configure app for testing
-    flask_app.config['TESTING'] = True
-    flask_app.config['WTF_CSRF_ENABLED'] = False  # Disable CSRF for tests
-    flask_app.config['SECRET_KEY'] = 'test-secret-key'
+    """Fixture providing Flask test client (app configured in pytest_configure)."""
+    _read_dataset.cache_clear()  # Don't reuse frames parsed (or mocked) by other tests
     
     with flask_app.test_client() as client:
         with flask_app.app_context():
             yield client
 
 
-@pytest.fixture
-def authenticated_client(flask_client):
-    """Fixture providing Flask client with session data."""
-    with flask_client.session_transaction() as sess:
-        sess['experiment_metadata'] = {
+@pytest.fixture(scope='session')
+def session_cookie():
+    """Fixture providing a signed session cookie carrying experiment metadata (built once)."""
+    serializer = flask_app.session_interface.get_signing_serializer(flask_app)
+    return serializer.dumps({
+        'experiment_metadata': {
             'dataset_id': 'TEST001',
             'stressor': 'Test Chemical',
             'dosing': '10 µM',
             'owner': 'Test User'
         }
+    })
+
+
+@pytest.fixture
+def authenticated_client(flask_client, session_cookie):
+    """Fixture providing Flask client with session data."""
+    flask_client.set_cookie(flask_app.config['SESSION_COOKIE_NAME'], session_cookie)
     return flask_client
 
 
@@ -138,15 +219,15 @@ def mock_reference_sets():
     }
 
 
-@pytest.fixture
+@pytest.fixture(scope='session')
 def column_detector():
-    """Fixture providing column detector instance."""
+    """Fixture providing column detector instance, shared per session along with its result cache."""
     return ColumnDetector()
 
 
-@pytest.fixture
+@pytest.fixture(scope='session')
 def gene_id_validator():
-    """Fixture providing gene ID validator instance."""
+    """Fixture providing gene ID validator instance (stateless, shared per session)."""
     return GeneIDValidator()
 
 
@@ -223,19 +304,20 @@ def create_test_csv():
 
 
 # Performance test fixtures
-@pytest.fixture
+@pytest.fixture(scope='session')
 def large_gene_dataset():
-    """Fixture providing a large dataset for performance testing."""
+    """Fixture providing a large dataset for performance testing (shared; copy before modifying)."""
     import numpy as np
     
     n_genes = 10000
-    gene_names = [f"GENE_{i:05d}" for i in range(n_genes)]
+    rng = np.random.default_rng(42)
+    gene_names = np.char.add('GENE_', np.char.zfill(np.arange(n_genes).astype(str), 5))
     
     return pd.DataFrame({
         'Gene_Symbol': gene_names,
-        'log2FoldChange': np.random.normal(0, 1.5, n_genes),
-        'padj': np.random.uniform(0, 0.1, n_genes),
-        'baseMean': np.random.lognormal(5, 2, n_genes)
+        'log2FoldChange': rng.normal(0, 1.5, n_genes),
+        'padj': rng.uniform(0, 0.1, n_genes),
+        'baseMean': rng.lognormal(5, 2, n_genes)
     })
 
 
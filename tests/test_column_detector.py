@@ -94,6 +94,12 @@ class TestColumnDetector:
         score = column_detector._score_column_name('random_column', column_detector.GENE_ID_PATTERNS)
         assert score == 0.0
     
+    def test_column_name_scoring_any_pattern(self, column_detector):
+        """Test that an exact match on any pattern in the group scores highest."""
+        assert column_detector._score_column_name(' PADJ ', column_detector.PVALUE_PATTERNS) == 1.0
+        assert column_detector._score_column_name('adj.P.Val', column_detector.PVALUE_PATTERNS) == 0.8
+        assert column_detector._score_column_name('lfcSE', column_detector.LOG2FC_PATTERNS) == 0.8
+    
     def test_gene_id_content_analysis(self, column_detector):
         """Test gene ID content analysis."""
         # Test with clear HGNC symbols
@@ -130,6 +136,44 @@ class TestColumnDetector:
         # Should mention range in reasons
         assert any('range' in reason.lower() for reason in suggestions.best_log2fc.reasons)
     
+    def test_numeric_columns_extracted_once(self, column_detector):
+        """Test that numeric and text columns share one numeric extraction."""
+        df = pd.DataFrame({
+            'fc': [1.5, None, -2.0],
+            'pval': ['0.01', 'n/a', None],
+            'genes': ['TP53', 'MYC', 'KRAS']
+        })
+        
+        numeric = column_detector._numeric_columns(df)
+        
+        assert list(numeric) == ['fc', 'pval', 'genes']
+        assert numeric['fc'][0] == 2 and numeric['fc'][1].tolist() == [1.5, -2.0]
+        assert numeric['pval'][0] == 2 and numeric['pval'][1].tolist() == [0.01]
+        assert numeric['genes'][0] == 3 and len(numeric['genes'][1]) == 0
+    
+    def test_detect_columns_cached_on_content(self, column_detector, sample_gene_data, mocker):
+        """Test that unchanged data reuses suggestions and edited or reordered data does not."""
+        first = column_detector.detect_columns(sample_gene_data)
+        detect = mocker.spy(column_detector, '_detect_columns')
+        
+        repeat = column_detector.detect_columns(sample_gene_data.copy())
+        assert detect.call_count == 0
+        assert repeat is not first
+        assert repeat.best_gene_id.column_name == first.best_gene_id.column_name
+        
+        # Mutating a returned result must not leak into the cache
+        repeat.gene_id_suggestions.clear()
+        assert column_detector.detect_columns(sample_gene_data).gene_id_suggestions
+        
+        edited = sample_gene_data.copy()
+        edited.loc[0, 'padj'] = 0.5
+        column_detector.detect_columns(edited)
+        assert detect.call_count == 1
+        
+        # Same rows in a different order get their own entry
+        column_detector.detect_columns(sample_gene_data.iloc[::-1].reset_index(drop=True))
+        assert detect.call_count == 2
+    
     def test_pvalue_range_analysis(self, column_detector):
         """Test p-value range analysis."""
         df = pd.DataFrame({
@@ -30,20 +30,38 @@ class TestDatabaseOperations:
         recreated = ExperimentMetadata.from_dict(metadata_dict)
         assert recreated.dataset_id == sample_metadata.dataset_id
         assert recreated.stressor == sample_metadata.stressor
+        assert recreated == sample_metadata
     
-    def test_database_initialization(self, temp_database):
+    def test_database_initialization(self):
         """Test database initialization and table creation."""
-        db_manager = temp_database
+        from sqlalchemy import inspect
+        from sqlalchemy.orm import scoped_session
+        from sqlalchemy.pool import StaticPool
         
-        # Check database is initialized
-        assert db_manager.engine is not None
-        assert db_manager.SessionLocal is not None
+        db_manager = DatabaseManager(db_url="sqlite://", poolclass=StaticPool)
+        assert db_manager.initialize()
         
         # Check tables exist
-        from sqlalchemy import inspect
         inspector = inspect(db_manager.engine)
         tables = inspector.get_table_names()
         assert 'experiments' in tables
+        
+        # Check the thread-local session registry
+        assert isinstance(db_manager.SessionLocal, scoped_session)
+        assert db_manager.get_session() is db_manager.get_session()
+        assert db_manager.get_session().expire_on_commit is False
+        
+        db_manager.SessionLocal.remove()
+        db_manager.engine.dispose()
+    
+    def test_sqlite_file_uses_wal_journal(self, tmp_path):
+        """Test that on-disk SQLite databases are opened in WAL mode."""
+        db_manager = DatabaseManager(db_url=f"sqlite:///{tmp_path / 'wal.db'}")
+        assert db_manager.initialize()
+        
+        with db_manager.engine.connect() as conn:
+            assert conn.exec_driver_sql("PRAGMA journal_mode").scalar() == 'wal'
+        db_manager.engine.dispose()
     
     def test_save_experiment_metadata(self, temp_database, sample_metadata):
         """Test saving experiment metadata to database."""
@@ -116,16 +134,14 @@ class TestDatabaseOperations:
         result = db_manager.get_experiment(99999)
         assert result is None
     
-    def test_list_experiments(self, temp_database, sample_metadata):
+    def test_list_experiments(self, temp_database, seed_experiments):
         """Test listing recent experiments."""
         db_manager = temp_database
         
         # Save multiple experiments
-        metadata_dict = sample_metadata.to_dict()
-        
-        for i in range(3):
-            metadata_dict['dataset_id'] = f"TEST{i:03d}"
-            db_manager.save_experiment_metadata(metadata=metadata_dict)
+        experiment_ids = seed_experiments([{'dataset_id': f"TEST{i:03d}"} for i in range(3)])
+        assert len(experiment_ids) == 3
+        assert db_manager.get_experiment(experiment_ids[2])['dataset_id'] == 'TEST002'
         
         # List experiments
         experiments = db_manager.list_experiments(limit=10)
@@ -137,23 +153,16 @@ class TestDatabaseOperations:
         dataset_ids = [exp['dataset_id'] for exp in experiments]
         assert 'TEST002' in dataset_ids  # Most recent should be included
     
-    def test_search_experiments(self, temp_database, sample_metadata):
+    def test_search_experiments(self, temp_database, seed_experiments):
         """Test searching experiments by metadata fields."""
         db_manager = temp_database
         
         # Save experiments with different metadata
-        base_metadata = sample_metadata.to_dict()
-        
-        test_cases = [
+        seed_experiments([
             {'dataset_id': 'SEARCH001', 'stressor': 'Chemical A', 'owner': 'User 1'},
             {'dataset_id': 'SEARCH002', 'stressor': 'Chemical B', 'owner': 'User 1'},
             {'dataset_id': 'OTHER001', 'stressor': 'Chemical A', 'owner': 'User 2'},
-        ]
-        
-        for case in test_cases:
-            metadata = base_metadata.copy()
-            metadata.update(case)
-            db_manager.save_experiment_metadata(metadata=metadata)
+        ])
         
         # Test search by dataset_id
         results = db_manager.search_experiments(dataset_id='SEARCH')
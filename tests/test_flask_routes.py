@@ -4,7 +4,95 @@ Integration tests for Flask routes and web functionality.
 
 import pytest
 import json
-from unittest.mock import patch, MagicMock
+import pandas as pd
+from types import MappingProxyType, SimpleNamespace
+from unittest.mock import MagicMock
+
+
+# Representative enrichment results, encoded once for all report route tests
+ENRICHMENT_JSON = json.dumps([
+    {'KE': 'KE:115', 'Title': 'Test KE', 'p_value': 0.001, 'FDR': 0.01}
+] * 100)
+
+# Form fields shared by the report generation route tests
+REPORT_PAYLOAD = {
+    'filename': 'test.csv',
+    'gene_count': '1000',
+    'significant_genes': '150',
+    'aop_id': 'AOP:1',
+    'aop_label': 'Test AOP',
+    'logfc_threshold': '1.0',
+    'pval_cutoff': '0.05',
+    'id_column': 'Gene_Symbol',
+    'fc_column': 'log2FoldChange',
+    'pval_column': 'padj',
+    'id_type': 'HGNC',
+    'enrichment_results': ENRICHMENT_JSON
+}
+
+# Read-only form payloads for the three steps of the full workflow test
+WORKFLOW_PREVIEW_FORM = MappingProxyType({
+    'demo_file': 'GSE90122_TO90137.tsv',
+    'dataset_id': 'INTEGRATION_TEST',
+    'stressor': 'Integration Chemical',
+    'owner': 'Integration User'
+})
+
+WORKFLOW_ANALYZE_FORM = MappingProxyType({
+    'filename': 'GSE90122_TO90137.tsv',
+    'id_column': 'Gene_Symbol',
+    'fc_column': 'log2FoldChange',
+    'pval_column': 'padj',
+    'aop_selection': 'AOP:1',
+    'logfc_threshold': '1.0',
+    'dataset_id': 'INTEGRATION_TEST'  # Carried from step 1
+})
+
+WORKFLOW_REPORT_FORM = MappingProxyType({
+    'format': 'html',
+    'filename': 'GSE90122_TO90137.tsv',
+    'gene_count': '1000',
+    'aop_id': 'AOP:1'
+})
+
+
+@pytest.fixture(scope='module')
+def mock_preview_df():
+    """Mock DataFrame returned by read_csv in the preview route tests."""
+    mock_df = MagicMock(spec=pd.DataFrame)
+    mock_df.head.return_value.to_dict.return_value = [
+        {'Gene_Symbol': 'BRCA1', 'log2FoldChange': 2.5, 'padj': 0.001}
+    ]
+    mock_df.columns.tolist.return_value = ['Gene_Symbol', 'log2FoldChange', 'padj']
+    return mock_df
+
+
+@pytest.fixture
+def analysis_mocks(mocker):
+    """Patch the services behind /analyze with preconfigured mocks in one step."""
+    # A small real frame in the processed layout is cheaper than chained mock lookups
+    processed_df = pd.DataFrame({
+        'ID': ['BRCA1', 'TP53', 'EGFR'],
+        'log2FC': [2.5, -1.8, 0.3],
+        'pval': [0.001, 0.01, 0.5],
+        'significant': [True, True, False]
+    })
+    mock_enrichment = MagicMock(spec=pd.DataFrame)
+    mock_enrichment.to_dict.return_value = []
+    
+    mocker.patch.multiple(
+        'app',
+        load_and_validate_data=MagicMock(return_value=processed_df),
+        process_gene_expression=MagicMock(return_value=(processed_df, {'total_genes': 1000})),
+        load_aop_data=MagicMock(return_value=(['KE:115'], [], {}, {})),
+        run_enrichment_analysis=MagicMock(return_value=mock_enrichment),
+        build_cytoscape_network=MagicMock(return_value={'nodes': [], 'edges': []}),
+        build_ke_gene_mapping=MagicMock(return_value={}),
+        guess_id_type=MagicMock(return_value='HGNC'),
+        cleanup_file=MagicMock(),
+        validate_file_path=MagicMock(return_value=True),
+    )
+    return SimpleNamespace(processed_df=processed_df, mock_enrichment=mock_enrichment)
 
 
 @pytest.mark.integration
@@ -15,35 +103,44 @@ class TestFlaskRoutes:
     def test_index_route(self, flask_client):
         """Test main index page loads correctly."""
         response = flask_client.get('/')
+        data = response.get_data()
         
         assert response.status_code == 200
-        assert b'Molecular Adverse Outcome Pathway Analyser' in response.data
-        assert b'Select Demo Dataset' in response.data
-        assert b'Experiment Information' in response.data  # Metadata form
+        assert b'Molecular Adverse Outcome Pathway Analyser' in data
+        assert b'Select Demo Dataset' in data
+        assert b'Experiment Information' in data  # Metadata form
     
-    def test_preview_route_with_demo_file(self, flask_client):
+    def test_preview_route_with_demo_file(self, flask_client, mock_preview_df, monkeypatch):
         """Test preview route with demo file selection."""
-        with patch('os.path.exists', return_value=True), \
-             patch('pandas.read_csv') as mock_read_csv:
-            
-            # Mock DataFrame
-            mock_df = MagicMock()
-            mock_df.head.return_value.to_dict.return_value = [
-                {'Gene_Symbol': 'BRCA1', 'log2FoldChange': 2.5, 'padj': 0.001}
-            ]
-            mock_df.columns.tolist.return_value = ['Gene_Symbol', 'log2FoldChange', 'padj']
-            mock_read_csv.return_value = mock_df
-            
-            response = flask_client.post('/preview', data={
-                'demo_file': 'GSE90122_TO90137.tsv',
-                'dataset_id': 'TEST001',
-                'stressor': 'Test Chemical',
-                'owner': 'Test User'
-            })
-            
-            assert response.status_code == 200
-            assert b'Preview top 5 rows' in response.data
-            assert b'Gene Symbol / ID column' in response.data
+        monkeypatch.setattr('os.path.exists', lambda path: True)
+        monkeypatch.setattr('pandas.read_csv', lambda *args, **kwargs: mock_preview_df)
+        
+        response = flask_client.post('/preview', data={
+            'demo_file': 'GSE90122_TO90137.tsv',
+            'dataset_id': 'TEST001',
+            'stressor': 'Test Chemical',
+            'owner': 'Test User'
+        })
+        data = response.get_data()
+        
+        assert response.status_code == 200
+        assert b'Preview top 5 rows' in data
+        assert b'Gene Symbol / ID column' in data
+    
+    def test_preview_dataset_parse_is_cached(self, flask_client, tmp_path):
+        """Test that repeat previews reuse the parsed file until it changes."""
+        from app import _read_dataset
+        
+        path = tmp_path / 'data.tsv'
+        path.write_text('ID\tlog2FC\nTP53\t1.5\n')
+        first = _read_dataset(str(path), path.stat().st_mtime_ns, path.stat().st_size)
+        
+        assert _read_dataset(str(path), path.stat().st_mtime_ns, path.stat().st_size) is first
+        
+        path.write_text('ID\tlog2FC\nTP53\t1.5\nMYC\t-2.0\n')
+        updated = _read_dataset(str(path), path.stat().st_mtime_ns, path.stat().st_size)
+        
+        assert len(updated) == 2
     
     def test_preview_route_missing_file(self, flask_client):
         """Test preview route with missing file."""
@@ -52,42 +149,53 @@ class TestFlaskRoutes:
         assert response.status_code == 400
         assert b'No dataset provided' in response.data
     
-    def test_analyze_route_success(self, flask_client, authenticated_client):
+    def test_analyze_route_success(self, flask_client, authenticated_client, analysis_mocks, monkeypatch):
         """Test successful analysis route."""
-        with patch('app.load_and_validate_data') as mock_load, \
-             patch('app.process_gene_expression') as mock_process, \
-             patch('app.load_aop_data') as mock_aop_data, \
-             patch('app.run_enrichment_analysis') as mock_enrichment, \
-             patch('app.build_cytoscape_network') as mock_network, \
-             patch('app.build_ke_gene_mapping') as mock_gene_mapping, \
-             patch('app.guess_id_type') as mock_id_type, \
-             patch('app.cleanup_file'), \
-             patch('os.path.exists', return_value=True), \
-             patch('app.validate_file_path', return_value=True):
-            
-            # Mock service responses
-            mock_df = MagicMock()
-            mock_df.__getitem__.return_value.__getitem__.return_value = 'HGNC'
-            mock_load.return_value = mock_df
-            mock_process.return_value = (mock_df, {'total_genes': 1000})
-            mock_aop_data.return_value = (['KE:115'], [], {}, {})
-            mock_enrichment.return_value = MagicMock()
-            mock_enrichment.return_value.to_dict.return_value = []
-            mock_network.return_value = {'nodes': [], 'edges': []}
-            mock_gene_mapping.return_value = {}
-            mock_id_type.return_value = 'HGNC'
-            
-            response = authenticated_client.post('/analyze', data={
-                'filename': 'test.csv',
-                'id_column': 'Gene_Symbol',
-                'fc_column': 'log2FoldChange',
-                'pval_column': 'padj',
-                'aop_selection': 'AOP:1',
-                'logfc_threshold': '1.0'
-            })
-            
-            assert response.status_code == 200
-            assert b'KE Enrichment Results' in response.data or b'results.html' in response.request.url
+        monkeypatch.setattr('os.path.exists', lambda path: True)
+        
+        response = authenticated_client.post('/analyze', data={
+            'filename': 'test.csv',
+            'id_column': 'Gene_Symbol',
+            'fc_column': 'log2FoldChange',
+            'pval_column': 'padj',
+            'aop_selection': 'AOP:1',
+            'logfc_threshold': '1.0'
+        })
+        
+        assert response.status_code == 200
+        assert b'KE Enrichment Results' in response.data or b'results.html' in response.request.url
+    
+    def test_infinite_odds_ratio_round_trip(self, authenticated_client, analysis_mocks, monkeypatch):
+        """Test that an infinite odds ratio survives the results page and prints as inf in the report."""
+        import html
+        import re
+        
+        analysis_mocks.mock_enrichment.to_dict.return_value = [{
+            'KE': 'KE:115', 'Title': 'Test KE', 'num_overlap': 3, 'total_KE_genes_in_dataset': 3,
+            'p_value': 0.001, 'FDR': 0.01, 'odds_ratio': float('inf')
+        }]
+        monkeypatch.setattr('os.path.exists', lambda path: True)
+        
+        response = authenticated_client.post('/analyze', data={
+            'filename': 'test.csv',
+            'id_column': 'Gene_Symbol',
+            'fc_column': 'log2FoldChange',
+            'pval_column': 'padj',
+            'aop_selection': 'AOP:1',
+            'logfc_threshold': '1.0'
+        })
+        table_json = re.search(
+            rb'<textarea name="enrichment_results"[^>]*>(.*?)</textarea>', response.get_data(), re.S
+        ).group(1).decode('utf-8')
+        
+        assert 'Infinity' in table_json
+        
+        report = authenticated_client.post('/generate_report', data={
+            **REPORT_PAYLOAD, 'format': 'html', 'enrichment_results': html.unescape(table_json)
+        })
+        
+        assert report.status_code == 200
+        assert b'<td>inf</td>' in report.get_data()
     
     def test_analyze_route_validation_error(self, flask_client):
         """Test analysis route with validation errors."""
@@ -101,55 +209,22 @@ class TestFlaskRoutes:
         assert response.status_code == 400
         assert b'Validation errors' in response.data
     
-    def test_generate_report_route_html(self, authenticated_client):
-        """Test HTML report generation route."""
-        with patch('app.report_generator.generate_html_report') as mock_generate:
-            mock_generate.return_value = '<html><body>Test Report</body></html>'
-            
-            response = authenticated_client.post('/generate_report', data={
-                'format': 'html',
-                'filename': 'test.csv',
-                'gene_count': '1000',
-                'significant_genes': '150',
-                'aop_id': 'AOP:1',
-                'aop_label': 'Test AOP',
-                'logfc_threshold': '1.0',
-                'pval_cutoff': '0.05',
-                'id_column': 'Gene_Symbol',
-                'fc_column': 'log2FoldChange',
-                'pval_column': 'padj',
-                'id_type': 'HGNC',
-                'enrichment_results': '[]'
-            })
-            
-            assert response.status_code == 200
-            assert response.headers['Content-Type'] == 'text/html; charset=utf-8'
-            assert b'Test Report' in response.data
-    
-    def test_generate_report_route_pdf(self, authenticated_client):
-        """Test PDF report generation route."""
-        with patch('app.report_generator.generate_pdf_report') as mock_generate:
-            mock_generate.return_value = b'%PDF-1.4 fake pdf content'
-            
-            response = authenticated_client.post('/generate_report', data={
-                'format': 'pdf',
-                'filename': 'test.csv',
-                'gene_count': '1000',
-                'significant_genes': '150',
-                'aop_id': 'AOP:1',
-                'aop_label': 'Test AOP',
-                'logfc_threshold': '1.0',
-                'pval_cutoff': '0.05',
-                'id_column': 'Gene_Symbol',
-                'fc_column': 'log2FoldChange',
-                'pval_column': 'padj',
-                'id_type': 'HGNC',
-                'enrichment_results': '[]'
-            })
-            
-            assert response.status_code == 200
-            assert response.headers['Content-Type'] == 'application/pdf'
-            assert b'PDF' in response.data
+    @pytest.mark.parametrize('report_format, patched_fn, rendered, content_type, body', [
+        ('html', 'app.report_generator.generate_html_report',
+         '<html><body>Test Report</body></html>', 'text/html; charset=utf-8', b'Test Report'),
+        ('pdf', 'app.report_generator.generate_pdf_report',
+         b'%PDF-1.4 fake pdf content', 'application/pdf', b'PDF'),
+    ], ids=['html', 'pdf'])
+    def test_generate_report_route(self, authenticated_client, mocker,
+                                   report_format, patched_fn, rendered, content_type, body):
+        """Test HTML and PDF report generation routes."""
+        mocker.patch(patched_fn, return_value=rendered)
+        
+        response = authenticated_client.post('/generate_report', data={**REPORT_PAYLOAD, 'format': report_format})
+        
+        assert response.status_code == 200
+        assert response.headers['Content-Type'] == content_type
+        assert body in response.data
     
     def test_generate_report_route_no_metadata(self, flask_client):
         """Test report generation without experiment metadata."""
@@ -178,18 +253,12 @@ class TestFlaskRoutes:
         assert response.status_code == 404
         assert b'Page not found' in response.data
     
-    def test_metadata_storage_in_session(self, flask_client):
+    def test_metadata_storage_in_session(self, flask_client, mock_preview_df, monkeypatch):
         """Test that metadata is stored in session during preview."""
-        with patch('os.path.exists', return_value=True), \
-             patch('pandas.read_csv') as mock_read_csv, \
-             flask_client.session_transaction() as sess:
-            
-            # Mock DataFrame
-            mock_df = MagicMock()
-            mock_df.head.return_value.to_dict.return_value = []
-            mock_df.columns.tolist.return_value = ['Gene_Symbol']
-            mock_read_csv.return_value = mock_df
-            
+        monkeypatch.setattr('os.path.exists', lambda path: True)
+        monkeypatch.setattr('pandas.read_csv', lambda *args, **kwargs: mock_preview_df)
+        
+        with flask_client.session_transaction() as sess:
             response = flask_client.post('/preview', data={
                 'demo_file': 'GSE90122_TO90137.tsv',
                 'dataset_id': 'SESSION_TEST',
@@ -215,64 +284,22 @@ class TestFlaskRoutes:
         assert response.status_code != 400 or b'CSRF token is missing' not in response.data
     
     @pytest.mark.slow
-    def test_full_workflow_integration(self, flask_client):
+    def test_full_workflow_integration(self, flask_client, analysis_mocks, monkeypatch):
         """Test complete workflow from upload to report generation."""
-        with patch('os.path.exists', return_value=True), \
-             patch('pandas.read_csv') as mock_read_csv, \
-             patch('app.load_and_validate_data') as mock_load, \
-             patch('app.process_gene_expression') as mock_process, \
-             patch('app.load_aop_data') as mock_aop_data, \
-             patch('app.run_enrichment_analysis') as mock_enrichment, \
-             patch('app.build_cytoscape_network') as mock_network, \
-             patch('app.build_ke_gene_mapping') as mock_gene_mapping, \
-             patch('app.guess_id_type') as mock_id_type, \
-             patch('app.cleanup_file'), \
-             patch('app.validate_file_path', return_value=True), \
-             patch('app.report_generator.generate_html_report') as mock_report:
-            
-            # Setup mocks
-            mock_df = MagicMock()
-            mock_df.head.return_value.to_dict.return_value = [{'Gene_Symbol': 'BRCA1'}]
-            mock_df.columns.tolist.return_value = ['Gene_Symbol', 'log2FoldChange', 'padj']
-            mock_read_csv.return_value = mock_df
-            
-            mock_load.return_value = mock_df
-            mock_process.return_value = (mock_df, {'total_genes': 1000})
-            mock_aop_data.return_value = (['KE:115'], [], {}, {})
-            mock_enrichment.return_value = MagicMock()
-            mock_enrichment.return_value.to_dict.return_value = []
-            mock_network.return_value = {'nodes': [], 'edges': []}
-            mock_gene_mapping.return_value = {}
-            mock_id_type.return_value = 'HGNC'
-            mock_report.return_value = '<html>Integration Test Report</html>'
-            
-            # Step 1: Preview with metadata
-            response1 = flask_client.post('/preview', data={
-                'demo_file': 'GSE90122_TO90137.tsv',
-                'dataset_id': 'INTEGRATION_TEST',
-                'stressor': 'Integration Chemical',
-                'owner': 'Integration User'
-            })
-            assert response1.status_code == 200
-            
-            # Step 2: Analyze
-            response2 = flask_client.post('/analyze', data={
-                'filename': 'GSE90122_TO90137.tsv',
-                'id_column': 'Gene_Symbol',
-                'fc_column': 'log2FoldChange',
-                'pval_column': 'padj',
-                'aop_selection': 'AOP:1',
-                'logfc_threshold': '1.0',
-                'dataset_id': 'INTEGRATION_TEST'  # Carried from step 1
-            })
-            assert response2.status_code == 200
-            
-            # Step 3: Generate report
-            response3 = flask_client.post('/generate_report', data={
-                'format': 'html',
-                'filename': 'GSE90122_TO90137.tsv',
-                'gene_count': '1000',
-                'aop_id': 'AOP:1'
-            })
-            assert response3.status_code == 200
-            assert b'Integration Test Report' in response3.data
\ No newline at end of file
+        monkeypatch.setattr('os.path.exists', lambda path: True)
+        monkeypatch.setattr('pandas.read_csv', lambda *args, **kwargs: analysis_mocks.processed_df)
+        monkeypatch.setattr('app.report_generator.generate_html_report',
+                            lambda report_data: '<html>Integration Test Report</html>')
+        
+        # Step 1: Preview with metadata
+        response1 = flask_client.post('/preview', data=WORKFLOW_PREVIEW_FORM)
+        assert response1.status_code == 200
+        
+        # Step 2: Analyze
+        response2 = flask_client.post('/analyze', data=WORKFLOW_ANALYZE_FORM)
+        assert response2.status_code == 200
+        
+        # Step 3: Generate report
+        response3 = flask_client.post('/generate_report', data=WORKFLOW_REPORT_FORM)
+        assert response3.status_code == 200
+        assert b'Integration Test Report' in response3.data
\ No newline at end of file
@@ -0,0 +1,73 @@
+"""
+Unit tests for gene ID validation service.
+"""
+
+import pytest
+import pandas as pd
+from services.gene_id_validator import GeneIDValidator
+
+
+@pytest.mark.unit
+class TestGeneIDValidator:
+    """Test gene ID validation functionality."""
+
+    def test_mixed_case_identifiers(self, gene_id_validator):
+        """Test that identifier types are detected regardless of case."""
+        result = gene_id_validator.validate_gene_ids(['tp53', 'Brca1', 'nm_000546', '1007_S_AT'])
+
+        assert result.type_distribution == {'HGNC': 2, 'RefSeq': 1, 'Probe': 1}
+        assert result.valid_ids == 4
+        assert not result.invalid_ids
+
+    def test_case_variants_count_as_one_valid_id(self, gene_id_validator):
+        """Test that the same ID in different case is counted once."""
+        result = gene_id_validator.validate_gene_ids(['TP53', 'tp53', 'Tp53', 'NM_000546', 'nm_000546'])
+
+        assert result.total_ids == 5
+        assert result.valid_ids == 2
+
+    def test_adaptive_sampling_stops_early(self, gene_id_validator):
+        """Test that a uniform column stops sampling once the type is clear."""
+        gene_ids = ['TP53'] * 500
+
+        adaptive = gene_id_validator.validate_gene_ids(gene_ids, adaptive=True)
+        exhaustive = gene_id_validator.validate_gene_ids(gene_ids)
+
+        assert adaptive.total_ids == GeneIDValidator.ADAPTIVE_MIN_SAMPLE
+        assert exhaustive.total_ids == 200
+        assert adaptive.id_type == exhaustive.id_type == 'HGNC'
+        assert adaptive.confidence == exhaustive.confidence == 1.0
+
+    def test_adaptive_sampling_keeps_mixed_columns(self, gene_id_validator):
+        """Test that mixed columns are still fully sampled."""
+        result = gene_id_validator.validate_gene_ids(['TP53', '7157'] * 200, adaptive=True)
+
+        assert result.total_ids == 200
+        assert result.mixed_types
+
+    def test_column_analysis_samples_adaptively(self, gene_id_validator):
+        """Test that column analysis stops sampling a uniform column early."""
+        analysis = gene_id_validator.analyze_gene_column(pd.Series(['TP53'] * 500))
+
+        assert analysis.validation_result.total_ids == GeneIDValidator.ADAPTIVE_MIN_SAMPLE
+        assert analysis.primary_type == 'HGNC'
+        assert analysis.confidence == 1.0
+
+    def test_series_and_list_inputs_agree(self, gene_id_validator):
+        """Test that Series input is cleaned the same way as list input."""
+        gene_ids = ['TP53', None, '  ', ' BRCA1 ', 'ENSG00000141510', 7157]
+
+        from_list = gene_id_validator.validate_gene_ids(gene_ids)
+        from_series = gene_id_validator.validate_gene_ids(pd.Series(gene_ids, dtype=object))
+
+        assert from_series == from_list
+        assert from_series.total_ids == 4
+
+    def test_series_sampling_skips_leading_blanks(self, gene_id_validator):
+        """Test that Series sampling looks past windows of empty entries."""
+        gene_ids = pd.Series([None] * 250 + ['  '] * 10 + ['TP53'] * 1000, dtype=object)
+
+        result = gene_id_validator.validate_gene_ids(gene_ids)
+
+        assert result.total_ids == 200
+        assert result.type_distribution == {'HGNC': 200}
@@ -2,8 +2,12 @@
 Unit tests for report generation service.
 """
 
+import base64
+import gzip
 import pytest
-from services.report_service import report_generator, ReportData, get_software_versions
+import numpy as np
+from io import BytesIO
+from services.report_service import report_generator, ReportData, get_software_versions, _VOLCANO_PALETTE, _image_size, _typed_array
 
 
 @pytest.mark.unit
@@ -23,6 +27,9 @@ class TestReportService:
             assert package in versions
             assert isinstance(versions[package], str)
             assert len(versions[package]) > 0
+        
+        # Versions are collected once per process
+        assert get_software_versions() is versions
     
     def test_report_data_creation(self, sample_report_data):
         """Test ReportData dataclass creation."""
@@ -107,6 +114,17 @@ class TestReportService:
         assert 'Test User' in html_content      # Owner
         assert 'Sample test experiment' in html_content  # Description
     
+    def test_user_fields_are_escaped(self, sample_report_data):
+        """Test that user-supplied metadata cannot inject markup into the report."""
+        sample_report_data.metadata['stressor'] = '<script>alert(1)</script>'
+        sample_report_data.filename = 'a<b>.csv'
+
+        html_content = report_generator.generate_html_report(sample_report_data)
+
+        assert '<script>alert(1)</script>' not in html_content
+        assert '&lt;script&gt;alert(1)&lt;/script&gt;' in html_content
+        assert 'a&lt;b&gt;.csv' in html_content
+
     def test_empty_enrichment_results(self):
         """Test report generation with empty enrichment results."""
         from datetime import datetime
@@ -134,6 +152,12 @@ class TestReportService:
         assert 'No enrichment results available' in html_content
         assert 'EMPTY_TEST' in html_content  # Still show metadata
     
+    def test_html_report_gzip(self, sample_report_data):
+        """Test that the gzip variant decompresses to the plain HTML report."""
+        compressed = report_generator.generate_html_report_gzip(sample_report_data)
+
+        assert gzip.decompress(compressed).decode('utf-8') == report_generator.generate_html_report(sample_report_data)
+
     def test_volcano_plot_without_plotly(self, sample_report_data, monkeypatch):
         """Test volcano plot generation when Plotly is not available."""
         # Mock Plotly as unavailable
@@ -145,6 +169,115 @@ class TestReportService:
         assert 'Volcano plot visualization not available' in html_content
         assert 'TEST001' in html_content  # Other sections should still work
     
+    def test_volcano_arrays_drop_nonpositive_pvalues(self, sample_volcano_data):
+        """Test that invalid p-values and fold changes are dropped from every volcano array."""
+        volcano_data = sample_volcano_data + [
+            {'ID': 'ZERO', 'log2FC': 4.0, 'pval': 0.0},
+            {'ID': 'NEG', 'log2FC': -4.0, 'pval': -0.1},
+            {'ID': 'NOFC', 'log2FC': float('nan'), 'pval': 0.001}
+        ]
+        
+        x_values, y_values, gene_names, color_codes = report_generator._prepare_volcano_arrays(
+            volcano_data, 2.0, 0.05
+        )
+        
+        assert len(x_values) == len(y_values) == len(gene_names) == len(color_codes) == 5
+        assert not {'ZERO', 'NEG', 'NOFC'} & set(gene_names)
+        assert color_codes.dtype == np.int8
+        assert [_VOLCANO_PALETTE[code] for code in color_codes] == ['red', 'green', 'red', 'blue', 'green']
+    
+    def test_typed_array_round_trip(self):
+        """Test that volcano arrays are encoded as plotly.js base64 typed arrays."""
+        values = np.array([0.5, -1.25, 3.0])
+
+        encoded = _typed_array(values)
+
+        assert encoded['dtype'] == 'f8'
+        assert np.array_equal(np.frombuffer(base64.b64decode(encoded['bdata']), dtype='<f8'), values)
+        assert _typed_array(np.array([1, 3], dtype=np.int8))['dtype'] == 'i1'
+
+    def test_volcano_plot_image_with_matplotlib(self, sample_volcano_data, monkeypatch):
+        """Test that the PDF volcano image renders without Plotly."""
+        pytest.importorskip('matplotlib')
+        monkeypatch.setattr('services.report_service.PLOTLY_AVAILABLE', False)
+        
+        img_bytes = report_generator._create_volcano_plot_image(
+            sample_volcano_data, 2.0, 0.05, width_px=720, height_px=475
+        )
+        
+        assert img_bytes.startswith(b'\x89PNG')
+        assert _image_size(img_bytes) == (720, 475)
+    
+    def test_html_volcano_is_drawn_lazily(self, sample_report_data, sample_volcano_data):
+        """Test that the interactive volcano ships as JSON for the lazy-plot script."""
+        pytest.importorskip('plotly')
+        sample_report_data.volcano_data = sample_volcano_data
+
+        html_content = report_generator.generate_html_report(sample_report_data)
+
+        assert 'data-figure="volcano-plot-figure"' in html_content
+        assert '<script type="application/json" id="volcano-plot-figure">' in html_content
+        assert 'IntersectionObserver' in html_content
+
+    def test_pdf_html_uses_static_volcano_image(self, sample_report_data, sample_volcano_data):
+        """Test that HTML rendered for WeasyPrint embeds a PNG instead of the Plotly script."""
+        pytest.importorskip('matplotlib')
+        sample_report_data.volcano_data = sample_volcano_data
+
+        html_content = report_generator._build_html_content(sample_report_data, inline_css=False, for_pdf=True)
+
+        assert 'data:image/png;base64,' in html_content
+        assert 'Plotly.newPlot' not in html_content
+
+    def test_reportlab_pdf_written_to_stream(self, sample_report_data):
+        """Test that ReportLab PDFs can be written straight to a caller's stream."""
+        pytest.importorskip('reportlab')
+        out = BytesIO()
+        
+        result = report_generator._generate_reportlab_pdf(sample_report_data, out)
+        
+        assert result is None
+        assert out.getvalue().startswith(b'%PDF')
+    
+    def test_svg_network_embedded_as_vector_drawing(self, sample_report_data):
+        """Test that SVG network images are drawn as vectors rather than embedded rasters."""
+        pytest.importorskip('reportlab')
+        pytest.importorskip('svglib')
+        sample_report_data.network_png = (
+            '<?xml version="1.0" encoding="UTF-8" standalone="no"?>'
+            '<svg xmlns="http://www.w3.org/2000/svg" width="800" height="400">'
+            '<circle cx="100" cy="100" r="40" fill="#b3e6b3"/></svg>'
+        )
+
+        pdf_bytes = report_generator._generate_reportlab_pdf(sample_report_data)
+
+        assert pdf_bytes.startswith(b'%PDF')
+        assert b'/Subtype /Image' not in pdf_bytes
+
+    def test_sections_built_once_per_report(self, sample_report_data):
+        """Test that pre-formatted sections are cached on the report data."""
+        sections = report_generator._build_sections(sample_report_data)
+
+        assert report_generator._build_sections(sample_report_data) is sections
+        assert sections['dataset_id'] == 'TEST001'
+        assert ('Total Genes', '1,000') in sections['input_summary']
+        assert len(sections['enrichment_rows']) == sections['enrichment_total'] == 1
+
+    def test_missing_fdr_highlighting(self, sample_report_data):
+        """Test that a missing FDR falls back to the p-value in HTML but is not highlighted in the PDF."""
+        from dataclasses import replace
+
+        report_data = replace(sample_report_data, enrichment_results=[
+            {'KE': 'KE:115', 'Title': 'No FDR', 'num_overlap': 3, 'total_KE_genes_in_dataset': 10,
+             'p_value': 0.001, 'odds_ratio': 2.0}
+        ])
+
+        row = report_generator._build_sections(report_data)['enrichment_rows'][0]
+
+        assert row['fdr'] == row['p_value']
+        assert row['significant']
+        assert not row['fdr_significant']
+
     def test_pdf_report_without_weasyprint(self, sample_report_data, monkeypatch):
         """Test PDF generation when WeasyPrint is not available."""
         # Mock WeasyPrint as unavailable
@@ -153,6 +286,32 @@ class TestReportService:
         with pytest.raises(RuntimeError, match="WeasyPrint is required"):
             report_generator.generate_pdf_report(sample_report_data)
     
+    @pytest.mark.slow
+    def test_pdf_reports_batch(self, sample_report_data):
+        """Test that batch PDF generation renders every report in worker processes."""
+        pytest.importorskip('reportlab')
+        from dataclasses import replace
+
+        batch = [sample_report_data, replace(sample_report_data, filename='second.csv')]
+
+        pdfs = report_generator.generate_pdf_reports_batch(batch, max_workers=2)
+
+        assert len(pdfs) == 2
+        assert all(pdf.startswith(b'%PDF') for pdf in pdfs)
+
+    @pytest.mark.slow
+    def test_html_reports_batch(self, sample_report_data):
+        """Test that batch HTML generation keeps the input order."""
+        from dataclasses import replace
+
+        batch = [sample_report_data, replace(sample_report_data, filename='second.csv')]
+
+        reports = report_generator.generate_html_reports_batch(batch, max_workers=2)
+
+        assert len(reports) == 2
+        assert 'second.csv' not in reports[0]
+        assert 'second.csv' in reports[1]
+
     @pytest.mark.slow
     def test_large_enrichment_results(self, sample_metadata):
         """Test report generation with large number of enrichment results."""
@@ -2,10 +2,17 @@
 Utility functions for the Molecular AOP Analyser application.
 """
 import os
+import json
 import time
 import logging
+from functools import lru_cache
 from config import Config
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
 def cleanup_file(filepath):
@@ -19,10 +26,10 @@ def cleanup_file(filepath):
         bool: True if file was removed or didn't exist, False if error occurred
     """
     try:
-        if os.path.exists(filepath):
-            os.remove(filepath)
-            logger.info(f"Cleaned up file: {filepath}")
-            return True
+        os.remove(filepath)
+        logger.info(f"Cleaned up file: {filepath}")
+        return True
+    except FileNotFoundError:
         return True
     except OSError as e:
         logger.error(f"Failed to cleanup file {filepath}: {e}")
@@ -47,12 +54,11 @@ def cleanup_old_uploads(max_age_hours=24):
     cutoff_time = current_time - (max_age_hours * 3600)
     
     try:
-        for filename in os.listdir(uploads_dir):
-            filepath = os.path.join(uploads_dir, filename)
-            if os.path.isfile(filepath):
-                file_age = os.path.getmtime(filepath)
-                if file_age < cutoff_time:
-                    if cleanup_file(filepath):
+        # scandir entries carry the file type from the directory listing itself
+        with os.scandir(uploads_dir) as entries:
+            for entry in entries:
+                if entry.is_file() and entry.stat().st_mtime < cutoff_time:
+                    if cleanup_file(entry.path):
                         cleaned_count += 1
                         
     except OSError as e:
@@ -63,6 +69,11 @@ def cleanup_old_uploads(max_age_hours=24):
     
     return cleaned_count
 
+@lru_cache(maxsize=4)
+def _abs_upload_dir(upload_folder):
+    """Absolute form of the uploads directory, resolved once per configured value."""
+    return os.path.abspath(upload_folder)
+
 def validate_file_path(filepath):
     """
     Validate that a file path is safe and within expected directories.
@@ -76,15 +87,22 @@ def validate_file_path(filepath):
     try:
         # Resolve the path and check if it's within uploads directory
         abs_filepath = os.path.abspath(filepath)
-        abs_uploads = os.path.abspath(Config.UPLOAD_FOLDER)
+        abs_uploads = _abs_upload_dir(Config.UPLOAD_FOLDER)
         
-        # Check if file is within uploads directory
-        if not abs_filepath.startswith(abs_uploads):
+        # Check if file is within uploads directory (a shared string prefix such as
+        # 'uploads_old' is not enough, so compare whole path components)
+        try:
+            inside_uploads = os.path.commonpath([abs_uploads, abs_filepath]) == abs_uploads
+        except ValueError:  # Paths on different drives
+            inside_uploads = False
+        if not inside_uploads:
             logger.warning(f"File path outside uploads directory: {filepath}")
             return False
             
         # Check if file exists
-        if not os.path.exists(abs_filepath):
+        try:
+            os.stat(abs_filepath)
+        except FileNotFoundError:
             logger.warning(f"File does not exist: {filepath}")
             return False
             
@@ -92,4 +110,46 @@ def validate_file_path(filepath):
         
     except Exception as e:
         logger.error(f"Error validating file path {filepath}: {e}")
-        return False
\ No newline at end of file
+        return False
+
+def dumps_json(obj):
+    """
+    Serialize an object to a JSON string, using orjson when it is installed.
+    
+    orjson encodes large payloads such as volcano and network data in C and
+    handles NumPy arrays natively; the standard library is the fallback.
+    Note that orjson writes NaN and infinite floats as null, so use json.dumps
+    for payloads where those values must round-trip.
+    
+    Args:
+        obj: JSON-serializable object
+    
+    Returns:
+        str: JSON text
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS).decode('utf-8')
+    return json.dumps(obj)
+
+def loads_json(text):
+    """
+    Parse a JSON string, using orjson when it is installed.
+    
+    Payloads orjson rejects but the standard library accepts (such as bare
+    NaN values) are retried with json.loads, so behaviour matches json.loads.
+    
+    Args:
+        text: JSON text
+    
+    Returns:
+        Parsed Python object
+    
+    Raises:
+        json.JSONDecodeError: If the text is not valid JSON
+    """
+    if orjson is not None:
+        try:
+            return orjson.loads(text)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(text)
@@ -3,12 +3,17 @@ Input validation utilities for the Molecular AOP Analyser application.
 """
 import re
 import logging
+from functools import lru_cache
 from typing import Dict, Any, List, Tuple, Union
 from werkzeug.datastructures import FileStorage
 from config import Config
 
 logger = logging.getLogger(__name__)
 
+# Characters rejected in column names and replaced in stored filenames
+_UNSAFE_COLUMN_RE = re.compile(r'[<>;"\'\\]')
+_UNSAFE_FILENAME_RE = re.compile(r'[<>:"|?*]')
+
 class ValidationError(Exception):
     """Custom exception for validation errors."""
     pass
@@ -34,6 +39,11 @@ def validate_file_upload(file: FileStorage) -> Tuple[bool, str]:
     if extension not in Config.ALLOWED_EXTENSIONS:
         return False, f"File type '{extension}' not allowed. Use: {', '.join(Config.ALLOWED_EXTENSIONS)}"
     
+    # Reject early on a declared part size that is already over the limit; the
+    # header is client-supplied, so smaller claims are still measured below
+    if (file.content_length or 0) > Config.MAX_FILE_SIZE:
+        return False, f"File too large. Maximum size is {Config.MAX_FILE_SIZE // (1024*1024)} MB"
+    
     # Check file size (approximate, as we can't get exact size from FileStorage easily)
     file.seek(0, 2)  # Seek to end
     size = file.tell()
@@ -65,7 +75,7 @@ def validate_column_name(column_name: str) -> Tuple[bool, str]:
         return False, "Column name too long"
     
     # Check for potentially dangerous characters
-    if re.search(r'[<>;"\'\\]', column_name):
+    if _UNSAFE_COLUMN_RE.search(column_name):
         return False, "Column name contains invalid characters"
     
     return True, ""
@@ -98,6 +108,12 @@ def validate_threshold(threshold_str: str) -> Tuple[bool, Union[float, str]]:
     except ValueError:
         return False, "Threshold must be a valid number"
 
+@lru_cache(maxsize=1)
+def _valid_aops() -> frozenset:
+    """IDs of the enabled case-study AOPs (call cache_clear() after changing Config)."""
+    return frozenset(aop_data.get('id') for aop_data in Config.CASE_STUDY_AOPS.values()
+                     if aop_data.get('id') and aop_data.get('enabled', True))
+
 def validate_aop_selection(aop_id: str) -> Tuple[bool, str]:
     """
     Validate AOP selection.
@@ -112,14 +128,23 @@ def validate_aop_selection(aop_id: str) -> Tuple[bool, str]:
         return False, "AOP selection is required"
     
     # Check if AOP exists in our configuration
-    valid_aops = [aop_data.get('id') for aop_data in Config.CASE_STUDY_AOPS.values() 
-                  if aop_data.get('id') and aop_data.get('enabled', True)]
-    
-    if aop_id not in valid_aops:
+    if aop_id not in _valid_aops():
         return False, f"Invalid AOP selection: {aop_id}"
     
     return True, ""
 
+# Fields every analysis form must fill in
+_REQUIRED_FIELDS = ('filename', 'id_column', 'fc_column', 'pval_column', 'aop_selection')
+
+# (field, validator, error prefix) applied to each field that is present
+_FIELD_VALIDATORS = (
+    ('id_column', validate_column_name, 'Gene ID column: '),
+    ('fc_column', validate_column_name, 'Log2FC column: '),
+    ('pval_column', validate_column_name, 'P-value column: '),
+    ('logfc_threshold', validate_threshold, 'Log2FC threshold: '),
+    ('aop_selection', validate_aop_selection, ''),
+)
+
 def validate_form_data(form_data: Dict[str, Any]) -> Tuple[bool, List[str]]:
     """
     Validate complete form data for analysis.
@@ -130,39 +155,17 @@ def validate_form_data(form_data: Dict[str, Any]) -> Tuple[bool, List[str]]:
     Returns:
         Tuple of (is_valid, list_of_error_messages)
     """
-    errors = []
-    
     # Required fields
-    required_fields = ['filename', 'id_column', 'fc_column', 'pval_column', 'aop_selection']
-    for field in required_fields:
-        if not form_data.get(field):
-            errors.append(f"Required field '{field}' is missing")
+    errors = [f"Required field '{field}' is missing"
+              for field in _REQUIRED_FIELDS if not form_data.get(field)]
     
     # Validate individual fields if present
-    if form_data.get('id_column'):
-        is_valid, error = validate_column_name(form_data['id_column'])
-        if not is_valid:
-            errors.append(f"Gene ID column: {error}")
-    
-    if form_data.get('fc_column'):
-        is_valid, error = validate_column_name(form_data['fc_column'])
-        if not is_valid:
-            errors.append(f"Log2FC column: {error}")
-    
-    if form_data.get('pval_column'):
-        is_valid, error = validate_column_name(form_data['pval_column'])
-        if not is_valid:
-            errors.append(f"P-value column: {error}")
-    
-    if form_data.get('logfc_threshold'):
-        is_valid, result = validate_threshold(form_data['logfc_threshold'])
-        if not is_valid:
-            errors.append(f"Log2FC threshold: {result}")
-    
-    if form_data.get('aop_selection'):
-        is_valid, error = validate_aop_selection(form_data['aop_selection'])
-        if not is_valid:
-            errors.append(error)
+    for field, validator, prefix in _FIELD_VALIDATORS:
+        value = form_data.get(field)
+        if value:
+            is_valid, error = validator(value)
+            if not is_valid:
+                errors.append(f"{prefix}{error}")
     
     return len(errors) == 0, errors
 
@@ -180,7 +183,7 @@ def sanitize_filename(filename: str) -> str:
     filename = filename.replace('..', '').replace('/', '').replace('\\', '')
     
     # Remove potentially dangerous characters
-    filename = re.sub(r'[<>:"|?*]', '_', filename)
+    filename = _UNSAFE_FILENAME_RE.sub('_', filename)
     
     # Ensure reasonable length
     if len(filename) > 100: